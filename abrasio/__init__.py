@@ -37,7 +37,8 @@ Usage:
         print(response.json())
 """
 
-from ._api import Abrasio
+from typing import TYPE_CHECKING
+
 from ._config import AbrasioConfig, FingerprintConfig
 from ._exceptions import (
     AbrasioError,
@@ -50,6 +51,9 @@ from ._exceptions import (
     BlockedError,
 )
 
+if TYPE_CHECKING:
+    from ._api import Abrasio
+
 __version__ = "0.1.0"
 __all__ = [
     "Abrasio",
@@ -63,4 +67,17 @@ __all__ = [
     "InsufficientFundsError",
     "RateLimitError",
     "BlockedError",
+    "drain",
 ]
+
+
+def __getattr__(name):
+    # PEP 562: keep `import abrasio` cheap for short-lived CLI use by
+    # deferring the browser machinery until Abrasio is first touched.
+    if name == "Abrasio":
+        from ._api import Abrasio
+        return Abrasio
+    if name == "drain":
+        from ._api import drain
+        return drain
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
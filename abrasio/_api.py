@@ -1,6 +1,7 @@
 """Main Abrasio class - unified interface for local and cloud browsers."""
 
 from typing import Optional, Union, TYPE_CHECKING
+import asyncio
 import logging
 
 from ._config import AbrasioConfig
@@ -11,6 +12,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("abrasio")
 
+# Cleanup tasks scheduled from __aexit__. Keeping strong references stops
+# the event loop from garbage-collecting them mid-flight; drain() flushes
+# them before shutdown.
+_PENDING_CLEANUPS = set()
+
+
+async def drain() -> None:
+    """Wait for background session cleanups scheduled by `async with` exits."""
+    if _PENDING_CLEANUPS:
+        await asyncio.gather(*tuple(_PENDING_CLEANUPS), return_exceptions=True)
+
 
 class Abrasio:
     """
@@ -79,7 +91,7 @@ class Abrasio:
 
         # Log mode
         mode = "CLOUD" if self.config.is_cloud_mode else "LOCAL"
-        logger.info(f"Abrasio initialized in {mode} mode")
+        logger.info("Abrasio initialized in %s mode", mode)
 
     @property
     def is_cloud(self) -> bool:
@@ -97,8 +109,17 @@ class Abrasio:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Async context manager exit."""
-        await self.close()
+        """
+        Async context manager exit.
+
+        Cleanup runs in the background so user code doesn't block on the
+        session-finish API round-trip (the session auto-expires server-side
+        regardless). Use `await abrasio.drain()` before process exit to
+        flush pending cleanups, or call `close()` directly to wait.
+        """
+        task = asyncio.get_running_loop().create_task(self.close())
+        _PENDING_CLEANUPS.add(task)
+        task.add_done_callback(_PENDING_CLEANUPS.discard)
 
     async def start(self) -> "Abrasio":
         """
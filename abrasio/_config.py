@@ -3,12 +3,38 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 import os
+import sys
 import logging
 
 logger = logging.getLogger("abrasio.config")
 
+# Slotted dataclasses halve per-instance memory and make field access a
+# C-level slot load; slots=True needs Python 3.10+, older versions just
+# keep the __dict__ layout.
+if sys.version_info >= (3, 10):
+    _SLOTS = {"slots": True}
+else:
+    _SLOTS = {}
 
-@dataclass
+# Region utilities, cached after the first successful import so the second
+# config constructed in a process pays zero import cost. None = not yet
+# attempted, False = unavailable.
+_fingerprint_utils = None
+
+
+def _get_fingerprint_utils():
+    global _fingerprint_utils
+    if _fingerprint_utils is None:
+        try:
+            from .utils import fingerprint
+            _fingerprint_utils = fingerprint
+        except ImportError:
+            # utils module not available yet during import
+            _fingerprint_utils = False
+    return _fingerprint_utils or None
+
+
+@dataclass(**_SLOTS)
 class FingerprintConfig:
     """
     Fingerprint protection settings (local mode only).
@@ -27,14 +53,19 @@ class FingerprintConfig:
             Makes canvas fingerprint unique per session.
         audio_noise: Add noise to AudioContext fingerprint reads.
             Makes audio fingerprint unique per session.
+        noise_in_iframes: Also patch canvas/audio APIs inside iframes.
+            Off by default: ad/tracker frames are never fingerprinted,
+            and skipping them avoids per-frame script compile cost on
+            frame-heavy pages.
     """
     webgl: bool = True
     webrtc: bool = True
     canvas_noise: bool = False
     audio_noise: bool = False
+    noise_in_iframes: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AbrasioConfig:
     """
     Configuration for Abrasio browser.
@@ -66,6 +97,8 @@ class AbrasioConfig:
         region: Target region for geo-targeting (e.g., "BR", "US"). Auto-configures locale/timezone.
         profile_id: Persistent profile ID for cloud mode
         auto_configure_region: Auto-configure locale/timezone from region/IP (default: True)
+        reuse_profile: Keep the temp profile directory across start/close
+            cycles of the same browser so Chrome warm-starts (default: True)
         extra_args: Extra browser launch arguments
     """
 
@@ -94,6 +127,9 @@ class AbrasioConfig:
     # Region auto-configuration
     auto_configure_region: bool = True  # Auto-configure locale/timezone from region
 
+    # Keep temp profile dir across start/close cycles (local mode)
+    reuse_profile: bool = True
+
     # Fingerprint protection (local mode only - ignored in cloud mode)
     fingerprint: FingerprintConfig = field(default_factory=FingerprintConfig)
 
@@ -104,8 +140,27 @@ class AbrasioConfig:
     # Internal: stores validation warnings
     _region_warnings: List[str] = field(default_factory=list, repr=False)
 
+    # Internal: cached mode decision (set in __post_init__)
+    _is_cloud: bool = field(default=False, init=False, repr=False)
+
+    # Internal: cached to_dict() output (invalidated on field mutation)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    def __setattr__(self, name, value):
+        # object.__setattr__ rather than super(): slots=True recreates the
+        # class, which breaks the zero-argument super() cell in here.
+        object.__setattr__(self, name, value)
+        # Any field mutation invalidates the cached to_dict() output
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
     def __post_init__(self):
         """Auto-configure and validate region settings after initialization."""
+        # Cache the mode decision once; it's consulted on every hot path
+        # (Abrasio.__init__, start, is_cloud/is_local) and the api_key
+        # never changes after construction.
+        self._is_cloud = bool(self.api_key) and self.api_key.startswith("sk_")
+
         # Cloud mode: Don't set locale/timezone, the cloud browser handles this
         if self.is_cloud_mode:
             logger.debug("Cloud mode detected. Locale/timezone will be set by cloud browser.")
@@ -128,6 +183,12 @@ class AbrasioConfig:
 
     def _auto_configure_from_ip(self):
         """Auto-configure locale and timezone from public IP address."""
+        # Escape hatch for environments where any outbound lookup on
+        # construction is unwanted (CI, air-gapped boxes)
+        if os.getenv("ABRASIO_SKIP_GEOIP"):
+            logger.debug("ABRASIO_SKIP_GEOIP set; skipping IP auto-configuration")
+            return
+
         try:
             from .utils.geolocation import get_locale_timezone_from_ip
 
@@ -144,56 +205,51 @@ class AbrasioConfig:
 
     def _auto_configure_from_region(self):
         """Auto-configure locale and timezone from region."""
-        try:
-            from .utils.fingerprint import auto_configure_region, REGION_CONFIG
-
-            if self.region.upper() not in REGION_CONFIG:
-                logger.warning(f"Unknown region '{self.region}'. Using defaults.")
-                return
+        fingerprint = _get_fingerprint_utils()
+        if fingerprint is None:
+            return
 
-            final_locale, final_timezone, warnings = auto_configure_region(
-                region=self.region,
-                locale=self.locale,
-                timezone=self.timezone,
-            )
+        if self.region.upper() not in fingerprint.REGION_CONFIG:
+            logger.warning(f"Unknown region '{self.region}'. Using defaults.")
+            return
 
-            # Only override if not explicitly set
-            if self.locale is None:
-                self.locale = final_locale
-                logger.debug(f"Auto-configured locale: {self.locale}")
+        final_locale, final_timezone, warnings = fingerprint.auto_configure_region(
+            region=self.region,
+            locale=self.locale,
+            timezone=self.timezone,
+        )
 
-            if self.timezone is None:
-                self.timezone = final_timezone
-                logger.debug(f"Auto-configured timezone: {self.timezone}")
+        # Only override if not explicitly set
+        if self.locale is None:
+            self.locale = final_locale
+            logger.debug(f"Auto-configured locale: {self.locale}")
 
-            self._region_warnings = warnings
+        if self.timezone is None:
+            self.timezone = final_timezone
+            logger.debug(f"Auto-configured timezone: {self.timezone}")
 
-            # Log warnings
-            for warning in warnings:
-                logger.warning(f"Region consistency: {warning}")
+        self._region_warnings = warnings
 
-        except ImportError:
-            # utils module not available yet during import
-            pass
+        # Log warnings
+        for warning in warnings:
+            logger.warning(f"Region consistency: {warning}")
 
     def _validate_region_consistency(self):
         """Validate region, locale, and timezone consistency."""
-        try:
-            from .utils.fingerprint import validate_region_consistency
-
-            warnings = validate_region_consistency(
-                region=self.region,
-                locale=self.locale,
-                timezone=self.timezone,
-            )
+        fingerprint = _get_fingerprint_utils()
+        if fingerprint is None:
+            return
 
-            self._region_warnings = warnings
+        warnings = fingerprint.validate_region_consistency(
+            region=self.region,
+            locale=self.locale,
+            timezone=self.timezone,
+        )
 
-            for warning in warnings:
-                logger.warning(f"Region consistency: {warning}")
+        self._region_warnings = warnings
 
-        except ImportError:
-            pass
+        for warning in warnings:
+            logger.warning(f"Region consistency: {warning}")
 
     @property
     def region_warnings(self) -> List[str]:
@@ -203,16 +259,23 @@ class AbrasioConfig:
     @property
     def is_cloud_mode(self) -> bool:
         """Check if running in cloud mode (has API key)."""
-        return self.api_key is not None and self.api_key.startswith("sk_")
+        return self._is_cloud
 
     @property
     def is_local_mode(self) -> bool:
         """Check if running in local mode (no API key)."""
-        return not self.is_cloud_mode
+        return not self._is_cloud
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        return {
+        """Convert config to dictionary (cached until a field changes).
+
+        A copy is returned so callers mutating the result cannot corrupt
+        the cache behind the __setattr__ invalidation.
+        """
+        if self._dict_cache is not None:
+            return self._copy_dict_cache()
+
+        self._dict_cache = {
             "api_key": self.api_key,
             "api_url": self.api_url,
             "headless": self.headless,
@@ -235,3 +298,10 @@ class AbrasioConfig:
             "extra_args": self.extra_args,
             "debug": self.debug,
         }
+        return self._copy_dict_cache()
+
+    def _copy_dict_cache(self) -> Dict[str, Any]:
+        """Copy the cached dict, including the nested fingerprint dict."""
+        result = dict(self._dict_cache)
+        result["fingerprint"] = dict(result["fingerprint"])
+        return result
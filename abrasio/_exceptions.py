@@ -1,75 +1,121 @@
 """Custom exceptions for Abrasio SDK."""
 
+import types
+from typing import Any, Mapping
+
+# Shared immutable default for `details`: most exceptions never carry any,
+# and the exception path is the hot path when a target blocks or rate-limits.
+_EMPTY: Mapping[str, Any] = types.MappingProxyType({})
+
 
 class AbrasioError(Exception):
     """Base exception for all Abrasio errors."""
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: dict = None):
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details is not None else _EMPTY
+
+    def __reduce__(self):
+        # Slot values are not captured by default exception pickling
+        return (self.__class__, (self.message, dict(self.details) or None))
 
 
 class AuthenticationError(AbrasioError):
     """Raised when API authentication fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Invalid or missing API key"):
         super().__init__(message)
 
+    def __reduce__(self):
+        return (self.__class__, (self.message,))
+
 
 class SessionError(AbrasioError):
     """Raised when session creation or management fails."""
 
+    __slots__ = ("session_id",)
+
     def __init__(self, message: str, session_id: str = None):
-        super().__init__(message, {"session_id": session_id})
+        super().__init__(message, {"session_id": session_id} if session_id is not None else None)
         self.session_id = session_id
 
+    def __reduce__(self):
+        return (self.__class__, (self.message, self.session_id))
+
 
 class BrowserError(AbrasioError):
     """Raised when browser operations fail."""
 
-    pass
+    __slots__ = ()
 
 
 class TimeoutError(AbrasioError):
     """Raised when an operation times out."""
 
+    __slots__ = ("timeout_ms",)
+
     def __init__(self, message: str = "Operation timed out", timeout_ms: int = None):
-        super().__init__(message, {"timeout_ms": timeout_ms})
+        super().__init__(message, {"timeout_ms": timeout_ms} if timeout_ms is not None else None)
         self.timeout_ms = timeout_ms
 
+    def __reduce__(self):
+        return (self.__class__, (self.message, self.timeout_ms))
+
 
 class InsufficientFundsError(AbrasioError):
     """Raised when user has insufficient balance (cloud mode)."""
 
+    __slots__ = ("balance",)
+
     def __init__(self, balance: float = None):
         message = "Insufficient funds in your Abrasio account"
         if balance is not None:
             message += f" (current balance: ${balance:.2f})"
-        super().__init__(message, {"balance": balance})
+        super().__init__(message, {"balance": balance} if balance is not None else None)
         self.balance = balance
 
+    def __reduce__(self):
+        return (self.__class__, (self.balance,))
+
 
 class RateLimitError(AbrasioError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, retry_after: int = None):
         message = "Rate limit exceeded"
         if retry_after:
             message += f". Retry after {retry_after} seconds"
-        super().__init__(message, {"retry_after": retry_after})
+        super().__init__(message, {"retry_after": retry_after} if retry_after is not None else None)
         self.retry_after = retry_after
 
+    def __reduce__(self):
+        return (self.__class__, (self.retry_after,))
+
 
 class BlockedError(AbrasioError):
     """Raised when the target site blocks the request."""
 
+    __slots__ = ("url", "status_code")
+
     def __init__(self, url: str = None, status_code: int = None):
         message = "Request was blocked by the target site"
         if url:
             message += f" ({url})"
         if status_code:
             message += f" - Status: {status_code}"
-        super().__init__(message, {"url": url, "status_code": status_code})
+        details = None
+        if url is not None or status_code is not None:
+            details = {"url": url, "status_code": status_code}
+        super().__init__(message, details)
         self.url = url
         self.status_code = status_code
+
+    def __reduce__(self):
+        return (self.__class__, (self.url, self.status_code))
@@ -1,6 +1,21 @@
 """Cloud (paid) mode - browser in Abrasio cloud with real fingerprints."""
 
-from .browser import CloudBrowser
-from .api_client import AbrasioAPIClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .browser import CloudBrowser
+    from .api_client import AbrasioAPIClient
 
 __all__ = ["CloudBrowser", "AbrasioAPIClient"]
+
+
+def __getattr__(name):
+    # PEP 562: defer importing the HTTP stack (httpx/curl_cffi) and
+    # patchright until cloud mode is actually used.
+    if name == "CloudBrowser":
+        from .browser import CloudBrowser
+        return CloudBrowser
+    if name == "AbrasioAPIClient":
+        from .api_client import AbrasioAPIClient
+        return AbrasioAPIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,36 @@
 """HTTP client for Abrasio API."""
 
 from typing import Optional, Dict, Any
+import json
 import logging
 import asyncio
 
-import httpx
+# curl_cffi is preferred when installed: native libcurl is faster than httpx
+# and impersonates a real browser's TLS fingerprint (JA3/JA4), which matters
+# even for control-plane traffic. Falls back to httpx otherwise.
+#
+# The distinct Timeout class only exists from curl_cffi 0.7; older
+# versions expose just the catch-all RequestsError, which would make the
+# retry path treat DNS and SSL failures as transient timeouts — so
+# pre-0.7 installs use the httpx backend instead.
+try:
+    from curl_cffi import CurlHttpVersion
+    from curl_cffi.requests import AsyncSession
+    from curl_cffi.requests.exceptions import Timeout as CurlTimeout
+    CURL_CFFI_AVAILABLE = True
+except ImportError:
+    CURL_CFFI_AVAILABLE = False
+    CurlHttpVersion = None
+    AsyncSession = None
+    CurlTimeout = None
+
+# orjson is 2-5x faster than stdlib json on the small payloads the API
+# returns (session status, balance, error detail); every poll/retry goes
+# through this path. Optional: pip install abrasio[perf]
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from .._config import AbrasioConfig
 from .._exceptions import (
@@ -23,6 +49,91 @@ MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 1.0  # seconds
 RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
 
+# Exponential backoff schedule, precomputed (attempt -> seconds)
+_BACKOFFS = tuple(RETRY_BACKOFF_BASE * (1 << i) for i in range(MAX_RETRIES))
+
+# Exceptions that should trigger the retry/backoff path. Extended with
+# httpx.TimeoutException by _load_httpx() if the fallback backend is used.
+_TIMEOUT_ERRORS: tuple = (CurlTimeout,) if CURL_CFFI_AVAILABLE else ()
+
+
+def _load_httpx():
+    """
+    Import the httpx fallback on first use.
+
+    httpx costs ~80ms on cold import; with curl_cffi installed it is never
+    needed, so keep it off the `import abrasio` path entirely.
+    """
+    global _TIMEOUT_ERRORS
+    import httpx
+
+    if httpx.TimeoutException not in _TIMEOUT_ERRORS:
+        _TIMEOUT_ERRORS = _TIMEOUT_ERRORS + (httpx.TimeoutException,)
+    return httpx
+
+# Browser profile for TLS impersonation (curl_cffi only)
+IMPERSONATE_PROFILE = "chrome131"
+
+# Process-wide pooled client. The session lifecycle (create -> poll loop ->
+# finish) issues many serial requests to the same host, so sharing one
+# connection pool across AbrasioAPIClient instances avoids a TCP+TLS
+# handshake per Abrasio() instance. Reference-counted: torn down when the
+# last client releases it. Auth is applied per-request so the pool can be
+# shared across API keys.
+_shared_client = None
+_shared_refcount = 0
+_shared_lock: Optional[asyncio.Lock] = None
+
+
+def _get_shared_lock() -> asyncio.Lock:
+    """Lazily create the lock so no event loop is required at import time."""
+    global _shared_lock
+    if _shared_lock is None:
+        _shared_lock = asyncio.Lock()
+    return _shared_lock
+
+
+async def _acquire_shared_client():
+    """Get the pooled HTTP client, creating it on first use."""
+    global _shared_client, _shared_refcount
+    async with _get_shared_lock():
+        if _shared_client is None:
+            if CURL_CFFI_AVAILABLE:
+                _shared_client = AsyncSession(
+                    impersonate=IMPERSONATE_PROFILE,
+                    timeout=30,
+                    http_version=CurlHttpVersion.V2_0,
+                )
+            else:
+                # HTTP/2 needs the h2 extra which isn't a hard dependency;
+                # keep-alive pooling alone removes the per-poll handshake.
+                httpx = _load_httpx()
+                _shared_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=32,
+                        max_connections=64,
+                        keepalive_expiry=300,
+                    ),
+                    timeout=httpx.Timeout(30.0),
+                )
+        _shared_refcount += 1
+        return _shared_client
+
+
+async def _release_shared_client() -> None:
+    """Drop one reference to the pooled client, closing it at zero."""
+    global _shared_client, _shared_refcount
+    async with _get_shared_lock():
+        _shared_refcount -= 1
+        if _shared_refcount <= 0 and _shared_client is not None:
+            client = _shared_client
+            _shared_client = None
+            _shared_refcount = 0
+            if hasattr(client, "aclose"):  # httpx
+                await client.aclose()
+            else:  # curl_cffi
+                await client.close()
+
 
 class AbrasioAPIClient:
     """
@@ -38,7 +149,10 @@ class AbrasioAPIClient:
     def __init__(self, config: AbrasioConfig):
         self.config = config
         self.base_url = config.api_url.rstrip("/")
-        self._client: Optional[httpx.AsyncClient] = None
+        # AsyncSession (curl_cffi) or httpx.AsyncClient, depending on availability
+        self._client = None
+        self._headers: Optional[Dict[str, str]] = None
+        self._request = None  # bound client.request, set in start()
 
     async def __aenter__(self) -> "AbrasioAPIClient":
         await self.start()
@@ -48,28 +162,22 @@ class AbrasioAPIClient:
         await self.close()
 
     async def start(self) -> None:
-        """Initialize HTTP client."""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={
-                "X-API-KEY": self.config.api_key,
-                "Content-Type": "application/json",
-                "User-Agent": f"abrasio-sdk-python/0.1.0",
-            },
-            timeout=httpx.Timeout(30.0),
-        )
+        """Initialize HTTP client (acquires the shared pool)."""
+        self._headers = {
+            "X-API-KEY": self.config.api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "abrasio-sdk-python/0.1.0",
+        }
+        self._client = await _acquire_shared_client()
+        # Bind once: saves a helper call + attribute chase per request
+        self._request = self._client.request
 
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Release the shared HTTP client."""
         if self._client:
-            await self._client.aclose()
             self._client = None
-
-    def _ensure_client(self) -> httpx.AsyncClient:
-        """Ensure client is initialized."""
-        if not self._client:
-            raise AbrasioError("API client not started. Call start() first.")
-        return self._client
+            self._request = None
+            await _release_shared_client()
 
     async def _request_with_retry(
         self,
@@ -82,45 +190,100 @@ class AbrasioAPIClient:
 
         Retries on 429 (rate limit), 502, 503, 504 with exponential backoff.
         Respects Retry-After header when present.
+
+        Specialized for the common case: against a healthy control plane
+        almost every call succeeds on the first attempt, so that attempt
+        runs without any loop machinery and only failures pay for the
+        backoff path in _request_retry_slow.
         """
-        client = self._ensure_client()
-        last_exception = None
+        request = self._request
+        if request is None:
+            raise AbrasioError("API client not started. Call start() first.")
 
-        for attempt in range(MAX_RETRIES + 1):
-            try:
-                response = await getattr(client, method)(path, **kwargs)
+        url = self.base_url + path
+        # Auth rides on each request since the pooled client is shared;
+        # caller headers are merged over the defaults, never replacing
+        # them (dropping X-API-KEY would turn the call into a 401)
+        caller_headers = kwargs.get("headers")
+        if caller_headers:
+            kwargs["headers"] = {**self._headers, **caller_headers}
+        else:
+            kwargs["headers"] = self._headers
+        method = method.upper()
+
+        try:
+            response = await request(method, url, **kwargs)
+        except _TIMEOUT_ERRORS:
+            return await self._request_retry_slow(request, method, url, path, kwargs, None)
+
+        code = response.status_code
+        # Retryable codes are 429 plus the contiguous 502-504 range;
+        # two integer compares beat a set hash on the polling path.
+        # (RETRYABLE_STATUS_CODES above documents the same set.)
+        if code != 429 and not (502 <= code <= 504):
+            return self._handle_response(response)
 
-                if response.status_code not in RETRYABLE_STATUS_CODES:
-                    return self._handle_response(response)
+        return await self._request_retry_slow(request, method, url, path, kwargs, response)
 
-                # Retryable status - calculate wait time
-                if attempt == MAX_RETRIES:
-                    return self._handle_response(response)
+    async def _request_retry_slow(
+        self,
+        request,
+        method: str,
+        url: str,
+        path: str,
+        kwargs: Dict[str, Any],
+        response,
+    ) -> Dict[str, Any]:
+        """
+        Backoff/retry path, entered after a retryable first attempt.
 
-                retry_after = response.headers.get("Retry-After")
+        `response` holds the retryable first response, or None if the
+        first attempt timed out.
+        """
+        last_exception = None
+        if response is None:
+            last_exception = TimeoutError(f"Request to {path} timed out")
+
+        for attempt in range(MAX_RETRIES):
+            # Back off for the failure of the previous attempt
+            if response is not None:
+                # Lowercase key matches the normalized form the header
+                # containers store internally
+                retry_after = response.headers.get("retry-after")
                 if retry_after:
-                    wait = min(float(retry_after), 30.0)
+                    try:
+                        wait = min(int(retry_after), 30)
+                    except ValueError:  # fractional values are rare but legal
+                        wait = min(float(retry_after), 30.0)
                 else:
-                    wait = RETRY_BACKOFF_BASE * (2 ** attempt)
+                    wait = _BACKOFFS[attempt]
 
                 logger.warning(
-                    f"Request to {path} returned {response.status_code}, "
-                    f"retrying in {wait:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})"
+                    "Request to %s returned %s, retrying in %.1fs (attempt %d/%d)",
+                    path, response.status_code, wait, attempt + 1, MAX_RETRIES,
+                )
+            else:
+                wait = _BACKOFFS[attempt]
+                logger.warning(
+                    "Request to %s timed out, retrying in %.1fs (attempt %d/%d)",
+                    path, wait, attempt + 1, MAX_RETRIES,
                 )
-                await asyncio.sleep(wait)
+            await asyncio.sleep(wait)
 
-            except httpx.TimeoutException:
+            try:
+                response = await request(method, url, **kwargs)
+            except _TIMEOUT_ERRORS:
+                response = None
                 last_exception = TimeoutError(f"Request to {path} timed out")
-                if attempt == MAX_RETRIES:
-                    raise last_exception
+                continue
 
-                wait = RETRY_BACKOFF_BASE * (2 ** attempt)
-                logger.warning(
-                    f"Request to {path} timed out, "
-                    f"retrying in {wait:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})"
-                )
-                await asyncio.sleep(wait)
+            code = response.status_code
+            if code != 429 and not (502 <= code <= 504):
+                return self._handle_response(response)
 
+        # Retries exhausted: surface the final response (or timeout)
+        if response is not None:
+            return self._handle_response(response)
         raise last_exception or AbrasioError("Request failed after retries")
 
     async def create_session(
@@ -181,12 +344,14 @@ class AbrasioAPIClient:
         """
         Wait for session to be ready.
 
-        Polls the session status until it's READY or fails.
+        Consumes the server-sent event stream for the session when the API
+        supports it (one request instead of one per second), falling back
+        to status polling otherwise.
 
         Args:
             session_id: Session ID
             timeout_seconds: Maximum time to wait
-            poll_interval: Time between polls
+            poll_interval: Time between polls (fallback mode only)
 
         Returns:
             Session data with ws_endpoint
@@ -195,14 +360,151 @@ class AbrasioAPIClient:
             TimeoutError: Session didn't become ready in time
             SessionError: Session failed
         """
-        elapsed = 0
+        # One deadline covers both phases: the polling fallback gets only
+        # whatever budget the event stream left, not a fresh timeout.
+        deadline = asyncio.get_running_loop().time() + timeout_seconds
+
+        try:
+            session = await asyncio.wait_for(
+                self._wait_for_ready_events(session_id),
+                timeout=timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Session {session_id} did not become ready within {timeout_seconds}s",
+                timeout_seconds * 1000,
+            )
+        except AbrasioError:
+            raise
+        except Exception as e:
+            logger.debug("Session event stream unavailable (%s), falling back to polling", e)
+            session = None
+
+        if session is not None:
+            return session
+
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Session {session_id} did not become ready within {timeout_seconds}s",
+                timeout_seconds * 1000,
+            )
+        return await self._wait_for_ready_poll(session_id, remaining, poll_interval)
+
+    async def subscribe_session_ready(self, session_id: str):
+        """
+        Subscribe to the push stream of status events for a session.
+
+        Yields each event payload the API emits (dicts with at least a
+        "status" key) until the server closes the stream. Ends without
+        yielding anything when the API does not expose the event
+        endpoint. This is the raw feed behind wait_for_ready; use it
+        directly to react to status changes without polling.
+
+        Args:
+            session_id: Session ID
+
+        Yields:
+            Parsed event payloads
+
+        Raises:
+            AbrasioError: Client not started
+        """
+        client = self._client
+        if client is None:
+            raise AbrasioError("API client not started. Call start() first.")
+        url = f"{self.base_url}/v1/browser/session/{session_id}/events"
+
+        if hasattr(client, "stream"):  # httpx
+            async with client.stream(
+                "GET", url, headers=self._headers, timeout=None
+            ) as response:
+                if response.status_code != 200:
+                    return
+                async for line in response.aiter_lines():
+                    event = self._parse_sse_line(line)
+                    if event is not None:
+                        yield event
+        else:  # curl_cffi
+            response = await client.request(
+                "GET", url, headers=self._headers, stream=True, timeout=None
+            )
+            try:
+                if response.status_code != 200:
+                    return
+                async for line in response.aiter_lines():
+                    event = self._parse_sse_line(line)
+                    if event is not None:
+                        yield event
+            finally:
+                await response.aclose()
+
+    async def _wait_for_ready_events(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Consume the session event stream until it becomes READY.
 
-        while elapsed < timeout_seconds:
+        Returns None if the server does not expose the event stream or it
+        ends without a READY event (caller falls back to polling).
+        """
+        async for event in self.subscribe_session_ready(session_id):
+            session = self._check_session_event(event, session_id)
+            if session is not None:
+                return session
+        return None
+
+    @staticmethod
+    def _parse_sse_line(line) -> Optional[Dict[str, Any]]:
+        """Decode one SSE line into its JSON payload (None for non-data lines)."""
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        line = line.strip()
+        if not line.startswith("data:"):
+            return None
+
+        try:
+            return _json_loads(line[5:].strip())
+        except ValueError:
+            return None
+
+    def _check_session_event(
+        self, session: Dict[str, Any], session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Interpret an event payload; return session data once READY."""
+        status = session.get("status")
+
+        if status == "READY":
+            logger.info("Session %s is ready", session_id)
+            return session
+
+        if status in ("FAILED", "ERROR"):
+            error_msg = session.get("error_message", "Unknown error")
+            raise SessionError(f"Session failed: {error_msg}", session_id)
+
+        if status == "FINISHED":
+            raise SessionError("Session already finished", session_id)
+
+        logger.debug("Session %s status: %s, waiting...", session_id, status)
+        return None
+
+    async def _wait_for_ready_poll(
+        self,
+        session_id: str,
+        timeout_seconds: float,
+        poll_interval: float,
+    ) -> Dict[str, Any]:
+        """Poll session status until READY (fallback when SSE is unavailable)."""
+        # Monotonic deadline: accumulating `elapsed += poll_interval`
+        # undercounts whenever get_session itself is slow, silently
+        # stretching the caller's timeout.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+
+        while loop.time() < deadline:
             session = await self.get_session(session_id)
             status = session.get("status")
 
             if status == "READY":
-                logger.info(f"Session {session_id} is ready")
+                logger.info("Session %s is ready", session_id)
                 return session
 
             if status in ("FAILED", "ERROR"):
@@ -212,9 +514,11 @@ class AbrasioAPIClient:
             if status == "FINISHED":
                 raise SessionError("Session already finished", session_id)
 
-            logger.debug(f"Session {session_id} status: {status}, waiting...")
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            logger.debug("Session %s status: %s, waiting...", session_id, status)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(poll_interval, remaining))
 
         raise TimeoutError(
             f"Session {session_id} did not become ready within {timeout_seconds}s",
@@ -233,33 +537,35 @@ class AbrasioAPIClient:
         """
         return await self._request_with_retry("post", f"/v1/browser/session/{session_id}/finish")
 
-    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+    def _handle_response(self, response) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions."""
-        if response.status_code == 200:
-            return response.json()
+        code = response.status_code
+
+        if code == 200:
+            return _json_loads(response.content)
 
-        if response.status_code == 401:
+        if code == 401:
             raise AuthenticationError()
 
-        if response.status_code == 402:
+        if code == 402:
             # Insufficient funds
-            data = response.json()
+            data = _json_loads(response.content)
             balance = data.get("balance")
             raise InsufficientFundsError(balance)
 
-        if response.status_code == 429:
+        if code == 429:
             # Rate limit
-            retry_after = response.headers.get("Retry-After")
+            retry_after = response.headers.get("retry-after")
             raise RateLimitError(int(retry_after) if retry_after else None)
 
-        if response.status_code == 404:
+        if code == 404:
             raise SessionError("Session not found")
 
         # Generic error
         try:
-            data = response.json()
+            data = _json_loads(response.content)
             detail = data.get("detail", "Unknown error")
         except Exception:
             detail = response.text
 
-        raise AbrasioError(f"API error ({response.status_code}): {detail}")
+        raise AbrasioError(f"API error ({code}): {detail}")
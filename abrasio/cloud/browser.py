@@ -1,6 +1,8 @@
 """Cloud browser implementation using Abrasio API with Patchright."""
 
 from typing import Optional, TYPE_CHECKING
+import asyncio
+import atexit
 import logging
 
 from patchright.async_api import async_playwright, Browser, BrowserContext, Page
@@ -30,6 +32,53 @@ class CloudBrowser:
     - Pay-per-use billing
     """
 
+    __slots__ = (
+        "config",
+        "_api_client",
+        "_playwright",
+        "_browser",
+        "_session_id",
+        "_ws_endpoint",
+        "_live_view_url",
+        "_default_context",
+        "_incognito_pool",
+        "_incognito_page_ctx",
+    )
+
+    # Process-wide Patchright driver, shared by all cloud sessions.
+    # async_playwright().start() spawns the Node driver subprocess — a
+    # several-hundred-ms cold start — so it is paid once per process and
+    # refcounted: the driver stops when the last session closes.
+    _playwright_singleton: Optional["Playwright"] = None
+    _playwright_refcount: int = 0
+    _playwright_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def _get_playwright_lock(cls) -> asyncio.Lock:
+        # Created lazily so importing this module never touches the event loop
+        if cls._playwright_lock is None:
+            cls._playwright_lock = asyncio.Lock()
+        return cls._playwright_lock
+
+    @classmethod
+    async def _acquire_playwright(cls) -> "Playwright":
+        async with cls._get_playwright_lock():
+            if cls._playwright_singleton is None:
+                cls._playwright_singleton = await async_playwright().start()
+                logger.debug("Patchright driver started")
+            cls._playwright_refcount += 1
+            return cls._playwright_singleton
+
+    @classmethod
+    async def _release_playwright(cls) -> None:
+        async with cls._get_playwright_lock():
+            cls._playwright_refcount -= 1
+            if cls._playwright_refcount <= 0 and cls._playwright_singleton is not None:
+                await cls._playwright_singleton.stop()
+                cls._playwright_singleton = None
+                cls._playwright_refcount = 0
+                logger.debug("Patchright driver stopped")
+
     def __init__(self, config: AbrasioConfig):
         self.config = config
         self._api_client: Optional[AbrasioAPIClient] = None
@@ -38,6 +87,9 @@ class CloudBrowser:
         self._session_id: Optional[str] = None
         self._ws_endpoint: Optional[str] = None
         self._live_view_url: Optional[str] = None
+        self._default_context: Optional[BrowserContext] = None
+        self._incognito_pool: list = []
+        self._incognito_page_ctx: dict = {}
 
     @property
     def browser(self) -> Browser:
@@ -82,46 +134,74 @@ class CloudBrowser:
 
         logger.info(f"Session created: {self._session_id}")
 
-        # Wait for session to be ready
-        session = await self._api_client.wait_for_ready(
-            self._session_id,
-            timeout_seconds=60,
-        )
-
-        self._ws_endpoint = session.get("ws_endpoint")
-        if not self._ws_endpoint:
-            raise SessionError("No WebSocket endpoint returned", self._session_id)
-
-        # Show live view URL if available
-        live_view_url = session.get("live_view_url")
-        if live_view_url:
-            self._live_view_url = live_view_url
-            print(f"\n[Abrasio] Live View: {live_view_url}\n")
-            logger.info(f"Live view available: {live_view_url}")
-
-        logger.info(f"Connecting to WebSocket: {self._ws_endpoint}")
-
-        # Connect via Patchright CDP (maintains stealth properties)
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.connect_over_cdp(self._ws_endpoint)
+        # The driver spawn is independent of session provisioning, so it
+        # runs while we wait for the session to come up — the slower of
+        # the two determines cold-start wall time instead of their sum.
+        playwright_task = asyncio.create_task(self._acquire_playwright())
+
+        try:
+            # Wait for session to be ready
+            session = await self._api_client.wait_for_ready(
+                self._session_id,
+                timeout_seconds=60,
+            )
+
+            self._ws_endpoint = session.get("ws_endpoint")
+            if not self._ws_endpoint:
+                raise SessionError("No WebSocket endpoint returned", self._session_id)
+
+            # Show live view URL if available
+            live_view_url = session.get("live_view_url")
+            if live_view_url:
+                self._live_view_url = live_view_url
+                logger.info(f"Live view available: {live_view_url}")
+
+            logger.info(f"Connecting to WebSocket: {self._ws_endpoint}")
+
+            # Connect via Patchright CDP (maintains stealth properties)
+            self._playwright = await playwright_task
+            self._browser = await self._playwright.chromium.connect_over_cdp(self._ws_endpoint)
+        except BaseException:
+            # Any failure before the connect succeeds must not leak the
+            # driver refcount (or leave the acquisition task unawaited)
+            self._playwright = None
+            try:
+                await playwright_task
+            except Exception:
+                pass
+            else:
+                await self._release_playwright()
+            raise
 
         logger.info("Connected to cloud browser")
 
     async def close(self) -> None:
         """Close browser and cleanup session."""
-        # Close browser connection
+        # Close browser connection (takes all contexts down with it)
         if self._browser:
             await self._browser.close()
             self._browser = None
+        self._default_context = None
+        self._incognito_pool.clear()
+        self._incognito_page_ctx.clear()
+
+        # Kick off the session-finish round-trip now so it overlaps with
+        # the driver teardown below instead of running after it
+        finish_task = None
+        if self._api_client and self._session_id:
+            finish_task = asyncio.create_task(
+                self._api_client.finish_session(self._session_id)
+            )
 
         if self._playwright:
-            await self._playwright.stop()
+            await self._release_playwright()
             self._playwright = None
 
-        # Notify API that session is finished
-        if self._api_client and self._session_id:
+        if finish_task is not None:
             try:
-                await self._api_client.finish_session(self._session_id)
+                # Best-effort: cap the round-trip, the session auto-expires
+                # server-side anyway
+                await asyncio.wait_for(finish_task, timeout=5.0)
                 logger.info(f"Session {self._session_id} finished")
             except Exception as e:
                 logger.warning(f"Failed to finish session: {e}")
@@ -151,11 +231,13 @@ class CloudBrowser:
 
         # For cloud browsers, we typically use the default context
         # that's pre-configured with the fingerprint
-        contexts = self._browser.contexts
-        if contexts:
-            return contexts[0]
-
-        return await self._browser.new_context(**kwargs)
+        if self._default_context is None:
+            contexts = self._browser.contexts
+            if contexts:
+                self._default_context = contexts[0]
+            else:
+                self._default_context = await self._browser.new_context(**kwargs)
+        return self._default_context
 
     async def new_page(self) -> Page:
         """
@@ -167,12 +249,85 @@ class CloudBrowser:
         if not self._browser:
             raise RuntimeError("Browser not connected")
 
-        # Get or create context
-        contexts = self._browser.contexts
-        if contexts:
-            context = contexts[0]
-        else:
-            context = await self._browser.new_context()
+        # Get or create context (cached: the contexts lookup is a CDP
+        # round-trip in some Patchright versions)
+        if self._default_context is None:
+            contexts = self._browser.contexts
+            if contexts:
+                self._default_context = contexts[0]
+            else:
+                self._default_context = await self._browser.new_context()
+
+        page = await self._default_context.new_page()
+        return page
 
+    async def acquire_incognito_context(self) -> BrowserContext:
+        """
+        Take an isolated incognito context from the pool.
+
+        Creates a fresh context only when the pool is empty; return it
+        with release_incognito_context() to be recycled instead of paying
+        context creation per use.
+        """
+        if not self._browser:
+            raise RuntimeError("Browser not connected")
+
+        if self._incognito_pool:
+            return self._incognito_pool.pop()
+        return await self._browser.new_context()
+
+    async def release_incognito_context(self, context: BrowserContext) -> None:
+        """
+        Return a context taken with acquire_incognito_context to the pool.
+
+        The used context is closed — its pages, cookies, storage and
+        cache die with it — and a fresh context is pooled in its place,
+        so the next borrower genuinely starts clean while acquisition
+        stays instant. The creation cost is paid here, off the
+        acquire path.
+        """
+        await context.close()
+        if self._browser:
+            self._incognito_pool.append(await self._browser.new_context())
+
+    async def new_incognito_page(self) -> Page:
+        """
+        Create a page in a pooled incognito context.
+
+        The page's context is tracked internally; hand the page to
+        release_incognito_page() when done so the context is recycled.
+
+        Returns:
+            Page isolated from the default context
+        """
+        context = await self.acquire_incognito_context()
         page = await context.new_page()
+        self._incognito_page_ctx[page] = context
         return page
+
+    async def release_incognito_page(self, page: Page) -> None:
+        """
+        Close a page from new_incognito_page and recycle its context.
+
+        Pages not created by new_incognito_page are simply closed.
+        """
+        context = self._incognito_page_ctx.pop(page, None)
+        if context is None:
+            await page.close()
+            return
+        # Closing the context takes the page down with it
+        await self.release_incognito_context(context)
+
+
+def _stop_playwright_at_exit() -> None:
+    """Best-effort shutdown of a driver leaked past the last close()."""
+    pw = CloudBrowser._playwright_singleton
+    if pw is not None:
+        try:
+            asyncio.run(pw.stop())
+        except Exception:
+            # Interpreter shutdown; the driver process dies with us anyway
+            pass
+
+
+atexit.register(_stop_playwright_at_exit)
@@ -32,6 +32,7 @@ from .client import (
     StealthClientSync,
     StealthResponse,
     BrowserImpersonation,
+    warm_impersonation,
 )
 
 __all__ = [
@@ -39,4 +40,5 @@ __all__ = [
     "StealthClientSync",
     "StealthResponse",
     "BrowserImpersonation",
+    "warm_impersonation",
 ]
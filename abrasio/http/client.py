@@ -21,12 +21,37 @@ References:
 from __future__ import annotations
 
 import asyncio
+import functools
 import random
-from dataclasses import dataclass, field
+import sys
+import threading
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 from urllib.parse import urljoin
 
+# Slotted dataclasses skip the per-instance __dict__; slots=True needs
+# Python 3.10+, older versions just keep the dict layout.
+if sys.version_info >= (3, 10):
+    _SLOTS = {"slots": True}
+else:
+    _SLOTS = {}
+
+# orjson parses raw bytes directly in C; the stdlib fallback decodes
+# first. Installed via the `perf` extra.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json as _json
+    def _json_loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8", "replace")
+        return _json.loads(data)
+    def _json_dumps(obj):
+        return _json.dumps(obj, separators=(",", ":")).encode()
+
 try:
     from curl_cffi import requests as curl_requests
     from curl_cffi.requests import AsyncSession, Session, Response
@@ -38,6 +63,20 @@ except ImportError:
     Session = None
     Response = None
 
+# CurlOpt is only needed for DNS pinning (CURLOPT_RESOLVE); older
+# curl_cffi builds without it simply skip the pin.
+try:
+    from curl_cffi import CurlOpt
+except ImportError:
+    CurlOpt = None
+
+# CurlHttpVersion lets callers force HTTP/2 (CURL_HTTP_VERSION_2TLS);
+# builds without it fall back to libcurl's default negotiation.
+try:
+    from curl_cffi import CurlHttpVersion
+except ImportError:
+    CurlHttpVersion = None
+
 
 class BrowserImpersonation(str, Enum):
     """
@@ -79,11 +118,7 @@ class BrowserImpersonation(str, Enum):
     @classmethod
     def random_chrome(cls) -> "BrowserImpersonation":
         """Get a random Chrome version."""
-        chrome_versions = [
-            cls.CHROME_120, cls.CHROME_119, cls.CHROME_118,
-            cls.CHROME_117, cls.CHROME_116, cls.CHROME_110,
-        ]
-        return random.choice(chrome_versions)
+        return random.choice(_CHROME_POOL)
 
     @classmethod
     def for_region(cls, region: str) -> "BrowserImpersonation":
@@ -104,18 +139,93 @@ class BrowserImpersonation(str, Enum):
         return cls.random_chrome()
 
 
-@dataclass
+# Rotation pool for random_chrome(). A module-level tuple instead of a
+# fresh list per call — random_chrome() runs once per request when
+# rotate_impersonation is on.
+_CHROME_POOL = (
+    BrowserImpersonation.CHROME_120,
+    BrowserImpersonation.CHROME_119,
+    BrowserImpersonation.CHROME_118,
+    BrowserImpersonation.CHROME_117,
+    BrowserImpersonation.CHROME_116,
+    BrowserImpersonation.CHROME_110,
+)
+
+
+# Accept-Language by region, shared by the async and sync clients.
+# Precomputed: these were rebuilt as dict literals on every call.
+_ACCEPT_LANG: Dict[str, str] = {
+    "US": "en-US,en;q=0.9",
+    "BR": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+    "GB": "en-GB,en;q=0.9,en-US;q=0.8",
+    "DE": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
+    "FR": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+    "ES": "es-ES,es;q=0.9,en-US;q=0.8,en;q=0.7",
+    "IT": "it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7",
+    "JP": "ja-JP,ja;q=0.9,en-US;q=0.8,en;q=0.7",
+    "KR": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "CN": "zh-CN,zh;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+_DEFAULT_ACCEPT_LANG = "en-US,en;q=0.9"
+
+# Sec-Ch-Ua by impersonation profile value. One hash lookup instead of a
+# chain of substring scans; profiles not listed fall back to Chrome 120.
+_DEFAULT_SEC_CH_UA = '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"'
+_SEC_CH_UA: Dict[str, str] = {
+    "chrome120": _DEFAULT_SEC_CH_UA,
+    "chrome119": '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"',
+    "chrome118": '"Chromium";v="118", "Google Chrome";v="118", "Not=A?Brand";v="99"',
+    "edge101": '"Microsoft Edge";v="101", "Chromium";v="101", "Not A;Brand";v="99"',
+    "edge99": '"Microsoft Edge";v="101", "Chromium";v="101", "Not A;Brand";v="99"',
+}
+
+
+# Sentinel for lazily materialized response fields
+_UNSET = object()
+
+
 class StealthResponse:
     """
     Response wrapper with useful properties.
 
     Provides a clean interface regardless of underlying HTTP library.
+    Body bytes and the header dict are materialized lazily on first
+    access, so status-only checks (HEAD requests, redirect probes)
+    never copy the payload.
     """
-    status_code: int
-    headers: Dict[str, str]
-    content: bytes
-    url: str
-    encoding: str = "utf-8"
+
+    __slots__ = ("_resp", "url", "status_code", "encoding", "_content", "_headers")
+
+    def __init__(self, response: Response):
+        self._resp = response
+        self.status_code = response.status_code
+        self.url = str(response.url)
+        self.encoding = response.encoding or "utf-8"
+        self._content = _UNSET
+        self._headers = _UNSET
+
+    @property
+    def content(self) -> bytes:
+        """Response body bytes (copied out of the raw response once)."""
+        if self._content is _UNSET:
+            self._content = self._resp.content
+        return self._content
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers, as the underlying case-insensitive mapping.
+
+        No copy is made, and lookups keep HTTP's case-insensitive
+        semantics ("Content-Type" and "content-type" both hit).
+        """
+        return self._resp.headers
+
+    @property
+    def headers_dict(self) -> Dict[str, str]:
+        """Response headers copied into a plain dict (cached, case-sensitive)."""
+        if self._headers is _UNSET:
+            self._headers = dict(self._resp.headers)
+        return self._headers
 
     @property
     def text(self) -> str:
@@ -128,9 +238,8 @@ class StealthResponse:
         return 200 <= self.status_code < 300
 
     def json(self) -> Any:
-        """Parse response as JSON."""
-        import json
-        return json.loads(self.text)
+        """Parse response as JSON (straight from bytes, no text decode)."""
+        return _json_loads(self.content)
 
     def raise_for_status(self) -> None:
         """Raise exception if response indicates an error."""
@@ -148,9 +257,16 @@ class TLSFingerprintError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class StealthClientConfig:
-    """Configuration for stealth HTTP client."""
+    """
+    Configuration for stealth HTTP client.
+
+    Frozen and fully hashable, so a config can key caches directly
+    (e.g. the convenience-function client pool). Headers and cookies
+    are stored as tuples of pairs for the same reason; the clients
+    convert back to dicts where the session needs them.
+    """
 
     # Browser impersonation (TLS fingerprint)
     impersonate: BrowserImpersonation = BrowserImpersonation.DEFAULT
@@ -169,10 +285,10 @@ class StealthClientConfig:
     verify: bool = True
 
     # Default headers (merged with request headers)
-    headers: Dict[str, str] = field(default_factory=dict)
+    headers: Tuple[Tuple[str, str], ...] = ()
 
     # Cookies
-    cookies: Dict[str, str] = field(default_factory=dict)
+    cookies: Tuple[Tuple[str, str], ...] = ()
 
     # Region for auto-configuration
     region: Optional[str] = None
@@ -180,32 +296,59 @@ class StealthClientConfig:
     # Auto-rotate impersonation on each request
     rotate_impersonation: bool = False
 
+    # Profiles rotation draws from; empty means the module Chrome pool
+    rotate_pool: Tuple[BrowserImpersonation, ...] = ()
 
-class StealthClient:
-    """
-    Async HTTP client with TLS fingerprinting.
+    # Pinned DNS entries ("host:port:ip"), forwarded to CURLOPT_RESOLVE
+    resolve: Tuple[str, ...] = ()
 
-    Uses curl_cffi to make requests that match real browser TLS fingerprints.
-    This bypasses JA3/JA4 fingerprint detection used by anti-bot systems.
+    # Force an HTTP version (2 = HTTP/2 over TLS); None negotiates
+    http_version: Optional[int] = None
 
-    Example:
-        async with StealthClient() as client:
-            # Simple GET
-            response = await client.get("https://example.com")
-            print(response.text)
 
-            # POST with JSON
-            response = await client.post(
-                "https://api.example.com/data",
-                json={"key": "value"}
-            )
+@functools.lru_cache(maxsize=None)
+def _default_headers_for(
+    impersonate: BrowserImpersonation,
+    region: Optional[str],
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Base default headers for an (impersonation, region) pair.
 
-            # With custom headers
-            response = await client.get(
-                "https://example.com",
-                headers={"Authorization": "Bearer token"}
-            )
+    Computed once per pair for the life of the process; stored as a
+    tuple of pairs, which dict() expands in a single C loop.
     """
+    region_key = (region or "US").upper()
+    return (
+        (
+            "Accept",
+            "text/html,application/xhtml+xml,application/xml;q=0.9,"
+            "image/avif,image/webp,image/apng,*/*;q=0.8",
+        ),
+        ("Accept-Encoding", "gzip, deflate, br"),
+        ("Accept-Language", _ACCEPT_LANG.get(region_key, _DEFAULT_ACCEPT_LANG)),
+        ("Cache-Control", "max-age=0"),
+        ("Sec-Ch-Ua", _SEC_CH_UA.get(impersonate.value, _DEFAULT_SEC_CH_UA)),
+        ("Sec-Ch-Ua-Mobile", "?0"),
+        ("Sec-Ch-Ua-Platform", '"Windows"'),
+        ("Sec-Fetch-Dest", "document"),
+        ("Sec-Fetch-Mode", "navigate"),
+        ("Sec-Fetch-Site", "none"),
+        ("Sec-Fetch-User", "?1"),
+        ("Upgrade-Insecure-Requests", "1"),
+    )
+
+
+class _StealthBase:
+    """
+    Shared machinery for the async and sync stealth clients.
+
+    Everything here is pure computation over ``self.config`` — header
+    construction, impersonation selection, request-kwarg assembly and
+    response wrapping. Keeping one code path means every hot-path
+    optimization lands in both clients at once.
+    """
+
+    __slots__ = ("config", "_session", "_request_impl", "_default_headers")
 
     def __init__(
         self,
@@ -216,7 +359,10 @@ class StealthClient:
         cookies: Optional[Dict[str, str]] = None,
         region: Optional[str] = None,
         rotate_impersonation: bool = False,
+        rotate_pool: Optional[List[Union[BrowserImpersonation, str]]] = None,
         verify: bool = True,
+        resolve: Optional[List[str]] = None,
+        http_version: Optional[int] = None,
     ):
         """
         Initialize stealth HTTP client.
@@ -229,7 +375,15 @@ class StealthClient:
             cookies: Default cookies for all requests
             region: Region for auto-configuring Accept-Language etc.
             rotate_impersonation: Rotate browser version on each request
+            rotate_pool: Profiles to rotate through (defaults to the
+                recent-Chrome pool); a small allowlist keeps every pick
+                an O(1) index into preparsed profiles
             verify: Verify SSL certificates
+            resolve: Pre-resolved "host:port:ip" entries pinned via
+                CURLOPT_RESOLVE, so requests to those hosts skip DNS
+                entirely
+            http_version: Force an HTTP version (2 forces HTTP/2 over
+                TLS so concurrent requests multiplex on one connection)
         """
         if not CURL_CFFI_AVAILABLE:
             raise TLSFingerprintError(
@@ -244,112 +398,175 @@ class StealthClient:
             impersonate=impersonate,
             timeout=timeout,
             proxy=proxy,
-            headers=headers or {},
-            cookies=cookies or {},
+            headers=tuple(headers.items()) if headers else (),
+            cookies=tuple(cookies.items()) if cookies else (),
             region=region,
             rotate_impersonation=rotate_impersonation,
+            rotate_pool=tuple(
+                BrowserImpersonation(p) if isinstance(p, str) else p
+                for p in rotate_pool
+            ) if rotate_pool else (),
             verify=verify,
+            resolve=tuple(resolve) if resolve else (),
+            http_version=http_version,
         )
 
-        self._session: Optional[AsyncSession] = None
-
-    async def __aenter__(self) -> "StealthClient":
-        await self.start()
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        await self.close()
-
-    async def start(self) -> None:
-        """Initialize the HTTP session."""
-        impersonate = self._get_impersonation()
+        self._session = None
+        self._request_impl = None
+        self._default_headers: Optional[Dict[str, str]] = None
 
-        self._session = AsyncSession(
-            impersonate=impersonate,
-            timeout=self.config.timeout,
-            proxies={"http": self.config.proxy, "https": self.config.proxy} if self.config.proxy else None,
-            verify=self.config.verify,
-            headers=self._build_default_headers(),
-        )
+    @property
+    def cookies(self):
+        """The live session cookie jar (None before start()).
 
-    async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        Exposed so callers can seed known cookies directly instead of
+        round-tripping through a Set-Cookie response.
+        """
+        return self._session.cookies if self._session else None
 
     def _get_impersonation(self) -> str:
         """Get browser impersonation string."""
         if self.config.rotate_impersonation:
-            return BrowserImpersonation.random_chrome().value
+            return random.choice(self.config.rotate_pool or _CHROME_POOL).value
         return self.config.impersonate.value
 
+    def _session_kwargs(self) -> Dict[str, Any]:
+        """Build constructor kwargs for the curl_cffi session.
+
+        Also caches the default header set: config is immutable after
+        start(), so headers are computed exactly once instead of per
+        request.
+        """
+        self._default_headers = self._build_default_headers()
+        kwargs = {
+            "impersonate": self._get_impersonation(),
+            "timeout": self.config.timeout,
+            "proxies": (
+                {"http": self.config.proxy, "https": self.config.proxy}
+                if self.config.proxy else None
+            ),
+            "verify": self.config.verify,
+            "headers": self._default_headers,
+            "cookies": dict(self.config.cookies) if self.config.cookies else None,
+        }
+        if self.config.resolve and CurlOpt is not None:
+            kwargs["curl_options"] = {CurlOpt.RESOLVE: list(self.config.resolve)}
+        if self.config.http_version == 2 and CurlHttpVersion is not None:
+            kwargs["http_version"] = CurlHttpVersion.V2TLS
+        return kwargs
+
     def _build_default_headers(self) -> Dict[str, str]:
         """Build default headers based on configuration."""
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Accept-Language": self._get_accept_language(),
-            "Cache-Control": "max-age=0",
-            "Sec-Ch-Ua": self._get_sec_ch_ua(),
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"',
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        headers = dict(_default_headers_for(self.config.impersonate, self.config.region))
 
-        # Merge with custom headers (custom takes precedence)
+        # Merge with custom headers (custom takes precedence;
+        # update() consumes the tuple of pairs directly)
         headers.update(self.config.headers)
         return headers
 
-    def _get_accept_language(self) -> str:
-        """Get Accept-Language header based on region."""
-        region = (self.config.region or "US").upper()
-
-        # Common Accept-Language values by region
-        languages = {
-            "US": "en-US,en;q=0.9",
-            "BR": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-            "GB": "en-GB,en;q=0.9,en-US;q=0.8",
-            "DE": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
-            "FR": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-            "ES": "es-ES,es;q=0.9,en-US;q=0.8,en;q=0.7",
-            "IT": "it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7",
-            "JP": "ja-JP,ja;q=0.9,en-US;q=0.8,en;q=0.7",
-            "KR": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "CN": "zh-CN,zh;q=0.9,en-US;q=0.8,en;q=0.7",
+    def _build_request_kwargs(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, str]],
+        data: Optional[Union[str, bytes, Dict]],
+        json: Optional[Dict[str, Any]],
+        cookies: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        allow_redirects: Optional[bool],
+    ) -> Dict[str, Any]:
+        """Assemble the final kwargs for `session.request(**kwargs)`.
+
+        Default headers and cookies live on the session (set in start()),
+        and curl_cffi merges them with per-request values itself — so only
+        the per-call overrides are passed through here, avoiding a second
+        merge in Python.
+        """
+        if json is not None:
+            # Serialize here (orjson when available) rather than letting
+            # curl_cffi re-encode the payload on every attempt. Callers
+            # holding pre-serialized bytes can pass them as `json` or
+            # `data` to skip even this step.
+            data = json if isinstance(json, (bytes, bytearray)) else _json_dumps(json)
+            json = None
+            if headers is None:
+                headers = {"Content-Type": "application/json"}
+            elif "Content-Type" not in headers:
+                headers = {**headers, "Content-Type": "application/json"}
+
+        return {
+            "method": method.upper(),
+            "url": url,
+            "headers": headers,
+            "params": params,
+            "data": data,
+            "json": json,
+            "cookies": cookies,
+            "timeout": timeout or self.config.timeout,
+            "allow_redirects": (
+                allow_redirects if allow_redirects is not None
+                else self.config.allow_redirects
+            ),
+            # Rotate impersonation if enabled; None uses the session default
+            "impersonate": self._get_impersonation() if self.config.rotate_impersonation else None,
         }
 
-        return languages.get(region, "en-US,en;q=0.9")
+    def _wrap_response(self, response: Response) -> StealthResponse:
+        """Wrap curl_cffi response in our response class."""
+        return StealthResponse(response)
 
-    def _get_sec_ch_ua(self) -> str:
-        """Get Sec-Ch-Ua header based on impersonation."""
-        imp = self.config.impersonate.value
 
-        if "chrome120" in imp:
-            return '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"'
-        if "chrome119" in imp:
-            return '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"'
-        if "chrome118" in imp:
-            return '"Chromium";v="118", "Google Chrome";v="118", "Not=A?Brand";v="99"'
-        if "edge" in imp:
-            return '"Microsoft Edge";v="101", "Chromium";v="101", "Not A;Brand";v="99"'
+class StealthClient(_StealthBase):
+    """
+    Async HTTP client with TLS fingerprinting.
 
-        # Default Chrome
-        return '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"'
+    Uses curl_cffi to make requests that match real browser TLS fingerprints.
+    This bypasses JA3/JA4 fingerprint detection used by anti-bot systems.
 
-    def _wrap_response(self, response: Response) -> StealthResponse:
-        """Wrap curl_cffi response in our response class."""
-        return StealthResponse(
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            content=response.content,
-            url=str(response.url),
-            encoding=response.encoding or "utf-8",
-        )
+    Example:
+        async with StealthClient() as client:
+            # Simple GET
+            response = await client.get("https://example.com")
+            print(response.text)
+
+            # POST with JSON
+            response = await client.post(
+                "https://api.example.com/data",
+                json={"key": "value"}
+            )
+
+            # With custom headers
+            response = await client.get(
+                "https://example.com",
+                headers={"Authorization": "Bearer token"}
+            )
+    """
+
+    __slots__ = ()
+
+    _session: Optional[AsyncSession]
+
+    async def __aenter__(self) -> "StealthClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Initialize the HTTP session."""
+        self._session = AsyncSession(**self._session_kwargs())
+        # Bound once: saves the _session.request attribute walk on the
+        # hottest line in the module
+        self._request_impl = self._session.request
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+            self._request_impl = None
 
     async def request(
         self,
@@ -384,35 +601,10 @@ class StealthClient:
         if not self._session:
             raise HTTPError("Client not started. Use 'async with' or call start().")
 
-        # Merge headers
-        req_headers = dict(self._build_default_headers())
-        if headers:
-            req_headers.update(headers)
-
-        # Merge cookies
-        req_cookies = dict(self.config.cookies)
-        if cookies:
-            req_cookies.update(cookies)
-
-        # Rotate impersonation if enabled
-        if self.config.rotate_impersonation:
-            impersonate = BrowserImpersonation.random_chrome().value
-        else:
-            impersonate = None  # Use session default
-
-        response = await self._session.request(
-            method=method.upper(),
-            url=url,
-            headers=req_headers,
-            params=params,
-            data=data,
-            json=json,
-            cookies=req_cookies if req_cookies else None,
-            timeout=timeout or self.config.timeout,
-            allow_redirects=allow_redirects if allow_redirects is not None else self.config.allow_redirects,
-            impersonate=impersonate,
+        kwargs = self._build_request_kwargs(
+            method, url, headers, params, data, json, cookies, timeout, allow_redirects,
         )
-
+        response = await self._request_impl(**kwargs)
         return self._wrap_response(response)
 
     async def get(self, url: str, **kwargs) -> StealthResponse:
@@ -439,8 +631,73 @@ class StealthClient:
         """Make an OPTIONS request."""
         return await self.request("OPTIONS", url, **kwargs)
 
+    async def gather(
+        self,
+        requests: List[tuple],
+        max_concurrency: int = 50,
+        **kwargs,
+    ) -> List[StealthResponse]:
+        """
+        Issue a batch of requests concurrently over the shared session.
+
+        All requests multiplex over the session's existing connections
+        (HTTP/2 streams on a single TLS handshake where the server
+        supports it), which is much cheaper than sequential awaits or
+        one client per URL.
+
+        Args:
+            requests: (method, url) pairs, e.g. [("GET", u1), ("GET", u2)]
+            max_concurrency: Cap on in-flight requests at any moment
+            **kwargs: Extra request options applied to every request
+
+        Returns:
+            List of StealthResponse in the same order as `requests`
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(method: str, url: str) -> StealthResponse:
+            async with sem:
+                return await self.request(method, url, **kwargs)
 
-class StealthClientSync:
+        return await asyncio.gather(*(_one(m, u) for m, u in requests))
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: Optional[bool] = None,
+    ):
+        """
+        Stream a response body chunk by chunk instead of buffering it.
+
+        Memory stays O(chunk) rather than O(body) — use this for
+        multi-MB pages or asset downloads; request() remains the
+        buffered path.
+
+        Yields:
+            Raw body bytes as they arrive
+        """
+        if not self._session:
+            raise HTTPError("Client not started. Use 'async with' or call start().")
+
+        kwargs = self._build_request_kwargs(
+            method, url, headers, params, None, None, cookies, timeout, allow_redirects,
+        )
+        kwargs["stream"] = True
+        response = await self._request_impl(**kwargs)
+        try:
+            async for chunk in response.aiter_content():
+                yield chunk
+        finally:
+            await response.aclose()
+
+
+class StealthClientSync(_StealthBase):
     """
     Synchronous HTTP client with TLS fingerprinting.
 
@@ -452,38 +709,9 @@ class StealthClientSync:
             print(response.text)
     """
 
-    def __init__(
-        self,
-        impersonate: Union[BrowserImpersonation, str] = BrowserImpersonation.DEFAULT,
-        timeout: float = 30.0,
-        proxy: Optional[str] = None,
-        headers: Optional[Dict[str, str]] = None,
-        cookies: Optional[Dict[str, str]] = None,
-        region: Optional[str] = None,
-        rotate_impersonation: bool = False,
-        verify: bool = True,
-    ):
-        if not CURL_CFFI_AVAILABLE:
-            raise TLSFingerprintError(
-                "curl_cffi is required for TLS fingerprinting. "
-                "Install with: pip install curl_cffi"
-            )
+    __slots__ = ()
 
-        if isinstance(impersonate, str):
-            impersonate = BrowserImpersonation(impersonate)
-
-        self.config = StealthClientConfig(
-            impersonate=impersonate,
-            timeout=timeout,
-            proxy=proxy,
-            headers=headers or {},
-            cookies=cookies or {},
-            region=region,
-            rotate_impersonation=rotate_impersonation,
-            verify=verify,
-        )
-
-        self._session: Optional[Session] = None
+    _session: Optional[Session]
 
     def __enter__(self) -> "StealthClientSync":
         self.start()
@@ -494,91 +722,15 @@ class StealthClientSync:
 
     def start(self) -> None:
         """Initialize the HTTP session."""
-        impersonate = self._get_impersonation()
-
-        self._session = Session(
-            impersonate=impersonate,
-            timeout=self.config.timeout,
-            proxies={"http": self.config.proxy, "https": self.config.proxy} if self.config.proxy else None,
-            verify=self.config.verify,
-            headers=self._build_default_headers(),
-        )
+        self._session = Session(**self._session_kwargs())
+        self._request_impl = self._session.request
 
     def close(self) -> None:
         """Close the HTTP session."""
         if self._session:
             self._session.close()
             self._session = None
-
-    def _get_impersonation(self) -> str:
-        """Get browser impersonation string."""
-        if self.config.rotate_impersonation:
-            return BrowserImpersonation.random_chrome().value
-        return self.config.impersonate.value
-
-    def _build_default_headers(self) -> Dict[str, str]:
-        """Build default headers based on configuration."""
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Accept-Language": self._get_accept_language(),
-            "Cache-Control": "max-age=0",
-            "Sec-Ch-Ua": self._get_sec_ch_ua(),
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"',
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-        }
-
-        headers.update(self.config.headers)
-        return headers
-
-    def _get_accept_language(self) -> str:
-        """Get Accept-Language header based on region."""
-        region = (self.config.region or "US").upper()
-
-        languages = {
-            "US": "en-US,en;q=0.9",
-            "BR": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-            "GB": "en-GB,en;q=0.9,en-US;q=0.8",
-            "DE": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
-            "FR": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-            "ES": "es-ES,es;q=0.9,en-US;q=0.8,en;q=0.7",
-            "IT": "it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7",
-            "JP": "ja-JP,ja;q=0.9,en-US;q=0.8,en;q=0.7",
-            "KR": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "CN": "zh-CN,zh;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
-
-        return languages.get(region, "en-US,en;q=0.9")
-
-    def _get_sec_ch_ua(self) -> str:
-        """Get Sec-Ch-Ua header based on impersonation."""
-        imp = self.config.impersonate.value
-
-        if "chrome120" in imp:
-            return '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"'
-        if "chrome119" in imp:
-            return '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"'
-        if "chrome118" in imp:
-            return '"Chromium";v="118", "Google Chrome";v="118", "Not=A?Brand";v="99"'
-        if "edge" in imp:
-            return '"Microsoft Edge";v="101", "Chromium";v="101", "Not A;Brand";v="99"'
-
-        return '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"'
-
-    def _wrap_response(self, response: Response) -> StealthResponse:
-        """Wrap curl_cffi response in our response class."""
-        return StealthResponse(
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            content=response.content,
-            url=str(response.url),
-            encoding=response.encoding or "utf-8",
-        )
+            self._request_impl = None
 
     def request(
         self,
@@ -597,32 +749,10 @@ class StealthClientSync:
         if not self._session:
             raise HTTPError("Client not started. Use 'with' or call start().")
 
-        req_headers = dict(self._build_default_headers())
-        if headers:
-            req_headers.update(headers)
-
-        req_cookies = dict(self.config.cookies)
-        if cookies:
-            req_cookies.update(cookies)
-
-        if self.config.rotate_impersonation:
-            impersonate = BrowserImpersonation.random_chrome().value
-        else:
-            impersonate = None
-
-        response = self._session.request(
-            method=method.upper(),
-            url=url,
-            headers=req_headers,
-            params=params,
-            data=data,
-            json=json,
-            cookies=req_cookies if req_cookies else None,
-            timeout=timeout or self.config.timeout,
-            allow_redirects=allow_redirects if allow_redirects is not None else self.config.allow_redirects,
-            impersonate=impersonate,
+        kwargs = self._build_request_kwargs(
+            method, url, headers, params, data, json, cookies, timeout, allow_redirects,
         )
-
+        response = self._request_impl(**kwargs)
         return self._wrap_response(response)
 
     def get(self, url: str, **kwargs) -> StealthResponse:
@@ -649,27 +779,154 @@ class StealthClientSync:
         """Make an OPTIONS request."""
         return self.request("OPTIONS", url, **kwargs)
 
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: Optional[bool] = None,
+    ):
+        """
+        Stream a response body chunk by chunk instead of buffering it.
+
+        Yields:
+            Raw body bytes as they arrive
+        """
+        if not self._session:
+            raise HTTPError("Client not started. Use 'with' or call start().")
+
+        kwargs = self._build_request_kwargs(
+            method, url, headers, params, None, None, cookies, timeout, allow_redirects,
+        )
+        kwargs["stream"] = True
+        response = self._request_impl(**kwargs)
+        try:
+            for chunk in response.iter_content():
+                yield chunk
+        finally:
+            response.close()
+
+
+def warm_impersonation(
+    impersonate: Union[BrowserImpersonation, str] = BrowserImpersonation.DEFAULT,
+) -> None:
+    """Construct and discard one session for a profile before first use.
+
+    libcurl initializes shared TLS state (cipher lists, backend tables)
+    lazily on the first handle that needs it; warming a profile at
+    startup moves that one-time cost out of the first real request.
+    Sessions created afterwards — sync or async — reuse the already
+    initialized state. No-op when curl_cffi is unavailable.
+    """
+    if not CURL_CFFI_AVAILABLE:
+        return
+    if isinstance(impersonate, BrowserImpersonation):
+        impersonate = impersonate.value
+    Session(impersonate=impersonate).close()
+
+
+# Long-lived clients backing the one-off convenience functions.
+#
+# Building a fresh client per call threw away the TLS handshake and the
+# HTTP/2 connection pool on every request. Clients are instead cached by
+# their construction options and kept open for the life of the process;
+# call shutdown_clients() / shutdown_sync_clients() for explicit teardown.
+_async_clients: Dict[tuple, StealthClient] = {}
+_async_clients_lock: Optional[asyncio.Lock] = None
+_sync_clients: Dict[tuple, StealthClientSync] = {}
+_sync_clients_lock = threading.Lock()
+
+
+def _freeze_kwarg(value: Any) -> Any:
+    """Convert a construction kwarg into a hashable equivalent."""
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+def _client_cache_key(kwargs: Dict[str, Any]) -> tuple:
+    """Freeze construction kwargs into a hashable cache key."""
+    return tuple(sorted((k, _freeze_kwarg(v)) for k, v in kwargs.items()))
+
+
+def _get_async_clients_lock() -> asyncio.Lock:
+    # Created lazily so importing this module never touches the event loop
+    global _async_clients_lock
+    if _async_clients_lock is None:
+        _async_clients_lock = asyncio.Lock()
+    return _async_clients_lock
+
+
+async def _get_async_client(**kwargs) -> StealthClient:
+    key = _client_cache_key(kwargs)
+    client = _async_clients.get(key)
+    if client is None:
+        async with _get_async_clients_lock():
+            client = _async_clients.get(key)
+            if client is None:
+                client = StealthClient(**kwargs)
+                await client.start()
+                _async_clients[key] = client
+    return client
+
+
+def _get_sync_client(**kwargs) -> StealthClientSync:
+    key = _client_cache_key(kwargs)
+    client = _sync_clients.get(key)
+    if client is None:
+        with _sync_clients_lock:
+            client = _sync_clients.get(key)
+            if client is None:
+                client = StealthClientSync(**kwargs)
+                client.start()
+                _sync_clients[key] = client
+    return client
+
+
+async def shutdown_clients() -> None:
+    """Close all cached async convenience clients."""
+    async with _get_async_clients_lock():
+        clients = list(_async_clients.values())
+        _async_clients.clear()
+    for client in clients:
+        await client.close()
+
+
+def shutdown_sync_clients() -> None:
+    """Close all cached sync convenience clients."""
+    with _sync_clients_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+    for client in clients:
+        client.close()
+
 
 # Convenience functions for one-off requests
 async def get(url: str, **kwargs) -> StealthResponse:
     """Make a one-off GET request with TLS fingerprinting."""
-    async with StealthClient(**kwargs) as client:
-        return await client.get(url)
+    client = await _get_async_client(**kwargs)
+    return await client.get(url)
 
 
 async def post(url: str, **kwargs) -> StealthResponse:
     """Make a one-off POST request with TLS fingerprinting."""
-    async with StealthClient(**kwargs) as client:
-        return await client.post(url, **kwargs)
+    client = await _get_async_client(**kwargs)
+    return await client.post(url)
 
 
 def get_sync(url: str, **kwargs) -> StealthResponse:
     """Make a one-off synchronous GET request with TLS fingerprinting."""
-    with StealthClientSync(**kwargs) as client:
-        return client.get(url)
+    client = _get_sync_client(**kwargs)
+    return client.get(url)
 
 
 def post_sync(url: str, **kwargs) -> StealthResponse:
     """Make a one-off synchronous POST request with TLS fingerprinting."""
-    with StealthClientSync(**kwargs) as client:
-        return client.post(url, **kwargs)
+    client = _get_sync_client(**kwargs)
+    return client.post(url)
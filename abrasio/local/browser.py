@@ -1,7 +1,8 @@
 """Stealth browser implementation using Patchright for maximum anti-detection."""
 
+import functools
 import os
-import tempfile
+import re
 from typing import Optional, TYPE_CHECKING
 import logging
 
@@ -18,34 +19,59 @@ logger = logging.getLogger("abrasio.local")
 # This makes the canvas fingerprint unique per session without breaking functionality.
 _CANVAS_NOISE_SCRIPT = """
 (() => {
+    "use strict";
     const originalGetImageData = CanvasRenderingContext2D.prototype.getImageData;
-    CanvasRenderingContext2D.prototype.getImageData = function(...args) {
-        const imageData = originalGetImageData.apply(this, args);
+    // Fixed arity + .call keeps V8's inline cache monomorphic and avoids
+    // materializing a rest-args array on a hot API
+    CanvasRenderingContext2D.prototype.getImageData = function(sx, sy, sw, sh, settings) {
+        const imageData = originalGetImageData.call(this, sx, sy, sw, sh, settings);
         const data = imageData.data;
-        for (let i = 0; i < data.length; i += 4) {
-            // Add +-1 noise to RGB channels (imperceptible)
-            data[i]     = data[i]     + (Math.random() < 0.5 ? -1 : 1) & 0xff;
-            data[i + 1] = data[i + 1] + (Math.random() < 0.5 ? -1 : 1) & 0xff;
-            data[i + 2] = data[i + 2] + (Math.random() < 0.5 ? -1 : 1) & 0xff;
+        const n = data.length;
+        // Bulk random bits instead of two Math.random() calls per channel
+        // (crypto fills at most 64KiB per call, hence the chunk loop)
+        const rnd = new Uint8Array(n);
+        for (let o = 0; o < n; o += 65536) {
+            crypto.getRandomValues(rnd.subarray(o, Math.min(o + 65536, n)));
+        }
+        // Flip the low bit of each RGB channel in 32-bit lanes; alpha is
+        // the high byte (little-endian) and stays masked out. The tight
+        // lane loop lets V8 auto-vectorize the pass.
+        const d32 = new Uint32Array(data.buffer, data.byteOffset, n >>> 2);
+        const r32 = new Uint32Array(rnd.buffer, 0, n >>> 2);
+        for (let i = 0; i < d32.length; i++) {
+            d32[i] ^= r32[i] & 0x00010101;
         }
         return imageData;
     };
-    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-    HTMLCanvasElement.prototype.toDataURL = function(...args) {
-        const ctx = this.getContext('2d');
+    // Track which canvases changed since the last noise application so
+    // repeated toDataURL/toBlob calls skip the O(w*h) readback entirely
+    const dirtyCanvases = new WeakMap();
+    for (const name of ['fillRect', 'strokeRect', 'fillText', 'strokeText',
+                        'drawImage', 'putImageData', 'fill', 'stroke']) {
+        const original = CanvasRenderingContext2D.prototype[name];
+        if (!original) continue;
+        CanvasRenderingContext2D.prototype[name] = function(...args) {
+            if (this.canvas) dirtyCanvases.set(this.canvas, true);
+            return original.apply(this, args);
+        };
+    }
+    const applyNoise = function(canvas) {
+        if (!dirtyCanvases.get(canvas)) return;
+        const ctx = canvas.getContext('2d');
         if (ctx) {
-            const imageData = ctx.getImageData(0, 0, this.width, this.height);
+            const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height);
             ctx.putImageData(imageData, 0, 0);
         }
+        dirtyCanvases.set(canvas, false);
+    };
+    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+    HTMLCanvasElement.prototype.toDataURL = function(...args) {
+        applyNoise(this);
         return originalToDataURL.apply(this, args);
     };
     const originalToBlob = HTMLCanvasElement.prototype.toBlob;
     HTMLCanvasElement.prototype.toBlob = function(callback, ...args) {
-        const ctx = this.getContext('2d');
-        if (ctx) {
-            const imageData = ctx.getImageData(0, 0, this.width, this.height);
-            ctx.putImageData(imageData, 0, 0);
-        }
+        applyNoise(this);
         return originalToBlob.call(this, callback, ...args);
     };
 })();
@@ -54,24 +80,170 @@ _CANVAS_NOISE_SCRIPT = """
 # Audio noise: adds subtle noise to AudioContext fingerprint reads.
 _AUDIO_NOISE_SCRIPT = """
 (() => {
+    "use strict";
+    // Pre-seeded noise rings: one second of 48kHz audio used to cost
+    // 48k Math.random() calls per read; indexing a ring with a rotating
+    // offset keeps the same statistical character at a fraction of the
+    // arithmetic, and the linear inner loop auto-vectorizes.
+    const FREQ_NOISE = new Float32Array(4096);
+    const CHAN_NOISE = new Float32Array(4096);
+    for (let i = 0; i < 4096; i++) {
+        FREQ_NOISE[i] = (Math.random() - 0.5) * 0.001;
+        CHAN_NOISE[i] = (Math.random() - 0.5) * 0.0001;
+    }
+    let off = 0;
     const originalGetFloatFrequencyData = AnalyserNode.prototype.getFloatFrequencyData;
     AnalyserNode.prototype.getFloatFrequencyData = function(array) {
         originalGetFloatFrequencyData.call(this, array);
-        for (let i = 0; i < array.length; i++) {
-            array[i] += (Math.random() - 0.5) * 0.001;
+        const L = array.length;
+        for (let i = 0; i < L; i++) {
+            array[i] += FREQ_NOISE[(i + off) & 4095];
         }
+        off = (off + L) & 4095;
     };
     const originalGetChannelData = AudioBuffer.prototype.getChannelData;
     AudioBuffer.prototype.getChannelData = function(channel) {
         const data = originalGetChannelData.call(this, channel);
-        for (let i = 0; i < data.length; i++) {
-            data[i] += (Math.random() - 0.5) * 0.0001;
+        const L = data.length;
+        for (let i = 0; i < L; i++) {
+            data[i] += CHAN_NOISE[(i + off) & 4095];
         }
+        off = (off + L) & 4095;
         return data;
     };
 })();
 """
 
+_JS_COMMENT_RE = re.compile(r"//[^\n]*")
+_JS_WS_RE = re.compile(r"\s+")
+_JS_PUNCT_RE = re.compile(r"\s*([{}();,=<>+\-*?:&\[\]|!])\s*")
+
+
+def _minify_js(src: str) -> str:
+    """
+    Strip comments and collapse whitespace from an init script.
+
+    Init scripts are re-parsed by V8 on every page and frame navigation,
+    so the injected source is pre-stripped once at import time instead
+    of shipping comments and indentation to the renderer each load.
+    """
+    src = _JS_COMMENT_RE.sub("", src)
+    src = _JS_WS_RE.sub(" ", src)
+    src = _JS_PUNCT_RE.sub(r"\1", src)
+    return src.strip()
+
+
+_CANVAS_NOISE_SCRIPT_MIN = _minify_js(_CANVAS_NOISE_SCRIPT)
+_AUDIO_NOISE_SCRIPT_MIN = _minify_js(_AUDIO_NOISE_SCRIPT)
+
+# Headless-mode User-Agent replacements by OS. Chrome reports
+# "HeadlessChrome" in headless mode, which is trivially detectable; the
+# exact version matters less than dropping that marker. Keyed by
+# platform.system() values.
+# Static stealth launch flags, shared across launches. _get_stealth_args
+# copies this and appends the config-dependent flags.
+_STEALTH_BASE_ARGS = (
+    # CRITICAL: prevents navigator.webdriver=true at the Blink level
+    # Patchright patches CDP, but this flag patches the renderer itself
+    "--disable-blink-features=AutomationControlled",
+
+    # Suppress first-run dialogs
+    "--no-first-run",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--no-default-browser-check",
+
+    # Disable infobars (e.g. "Chrome is being controlled by automated software")
+    "--disable-infobars",
+    "--disable-popup-blocking",
+    "--disable-component-update",
+    "--disable-default-apps",
+
+    # Window size (realistic desktop)
+    #"--window-size=1920,1080",
+)
+
+# WebGL: only needed when DISABLING (enabled by default in Chrome)
+_WEBGL_DISABLE_ARGS = ("--disable-webgl", "--disable-webgl2")
+
+# WebRTC: block IP leak when disabled (important with proxy)
+_WEBRTC_DISABLE_ARGS = (
+    "--enforce-webrtc-ip-permission-check",
+    "--disable-webrtc-multiple-routes",
+    "--disable-webrtc-hw-encoding",
+)
+
+_HEADLESS_UA_BY_OS = {
+    "Windows": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Darwin": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Linux": (
+        "Mozilla/5.0 (X11; Linux x86_64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0.0.0 Safari/537.36"
+    ),
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _compute_stealth_args(
+    webgl: bool,
+    webrtc: bool,
+    headless: bool,
+    extra_args: tuple,
+    system: str,
+) -> tuple:
+    """Compute the launch-arg tuple for one stealth flag combination."""
+    args = [*_STEALTH_BASE_ARGS]
+
+    # Fix User-Agent in headless mode: Chrome adds "HeadlessChrome" which
+    # is detectable; the replacement UA just needs to drop that marker
+    # while staying consistent with the installed Chrome.
+    if headless:
+        user_agent = _HEADLESS_UA_BY_OS.get(system, _HEADLESS_UA_BY_OS["Linux"])
+        args.append(f"--user-agent={user_agent}")
+
+    if not webgl:
+        args.extend(_WEBGL_DISABLE_ARGS)
+
+    if not webrtc:
+        args.extend(_WEBRTC_DISABLE_ARGS)
+
+    args.extend(extra_args)
+    return tuple(args)
+
+
+@functools.lru_cache(maxsize=None)
+def _composed_noise_script(canvas: bool, audio: bool, in_iframes: bool) -> Optional[str]:
+    """Final init-script string for a noise flag combination.
+
+    Cached per combination so repeated start() calls — and every browser
+    in the process sharing the same config — reuse one composed string
+    instead of re-joining and re-wrapping it each launch.
+    """
+    parts = []
+    if canvas:
+        parts.append(_CANVAS_NOISE_SCRIPT_MIN)
+    if audio:
+        parts.append(_AUDIO_NOISE_SCRIPT_MIN)
+    if not parts:
+        return None
+
+    script = "\n".join(parts)
+    if not in_iframes:
+        # Top frame only: typical pages spawn dozens of ad/tracker
+        # iframes that are never fingerprinted, so skipping them saves a
+        # compile-and-patch pass per frame
+        script = "(()=>{if(window.top!==window)return;\n" + script + "\n})();"
+    return script
+
 
 class StealthBrowser:
     """
@@ -90,11 +262,41 @@ class StealthBrowser:
     - Uses no_viewport=True for realistic behavior
     """
 
+    __slots__ = (
+        "config",
+        "_playwright",
+        "_context",
+        "_user_data_dir",
+        "_owns_user_data_dir",
+        "_base_launch_kwargs",
+    )
+
     def __init__(self, config: AbrasioConfig):
         self.config = config
         self._playwright: Optional["Playwright"] = None
         self._context: Optional[BrowserContext] = None
         self._user_data_dir: Optional[str] = None
+        self._owns_user_data_dir = False
+        # Everything config-derived is frozen here once; start() only
+        # adds the per-launch entries (profile dir and args)
+        self._base_launch_kwargs = {
+            # Key: use channel="chrome" for real Chrome, not Chromium
+            "channel": "chrome",
+            "headless": config.headless,
+            "proxy": {"server": config.proxy} if config.proxy else None,
+            # IMPORTANT: no_viewport=True for realistic behavior
+            # Setting viewport can be detected as automation
+            "no_viewport": not config.viewport,
+            "viewport": config.viewport if config.viewport else None,
+            # DO NOT set user_agent - let real Chrome handle it
+            # Custom user_agent is easily detected via fingerprint mismatch
+            "ignore_default_args": [
+                "--enable-automation",
+                "--disable-extensions",
+            ],
+            # Permissions that real browsers have
+            "permissions": ["geolocation", "notifications"],
+        }
 
     @property
     def context(self) -> BrowserContext:
@@ -118,49 +320,37 @@ class StealthBrowser:
         # Create persistent user data directory
         if self.config.user_data_dir:
             self._user_data_dir = self.config.user_data_dir
-        else:
-            # Create temp dir that persists for session
+        elif self._user_data_dir is None:
+            # Create temp dir once; it survives close() so a restarted
+            # browser warm-starts from the existing profile instead of
+            # rebuilding it from scratch. (tempfile is imported lazily
+            # to keep module import light.)
+            import tempfile
+
             self._user_data_dir = tempfile.mkdtemp(prefix="abrasio_profile_")
+            self._owns_user_data_dir = True
 
         # Build launch arguments for stealth
         args = self._get_stealth_args()
 
-        # Proxy configuration
-        proxy = None
-        if self.config.proxy:
-            proxy = {"server": self.config.proxy}
-
         # Launch with persistent context for maximum stealth
-        # Key: use channel="chrome" for real Chrome, not Chromium
-        self._context = await self._playwright.chromium.launch_persistent_context(
-            user_data_dir=self._user_data_dir,
-            channel="chrome",  # Use real Chrome for better fingerprint
-            headless=self.config.headless,
-            args=args,
-            proxy=proxy,
-            # IMPORTANT: no_viewport=True for realistic behavior
-            # Setting viewport can be detected as automation
-            no_viewport=not self.config.viewport,
-            viewport=self.config.viewport if self.config.viewport else None,
-            # Locale and timezone (these are safe to set)
-            #locale=self.config.locale,
-            #timezone_id=self.config.timezone,
-            # DO NOT set user_agent - let real Chrome handle it
-            # Custom user_agent is easily detected via fingerprint mismatch
-            ignore_default_args=[
-                "--enable-automation",
-                "--disable-extensions",
-            ],
-            # Permissions that real browsers have
-            permissions=["geolocation", "notifications"],
-        )
+        kw = dict(self._base_launch_kwargs)
+        kw["user_data_dir"] = self._user_data_dir
+        kw["args"] = args
+        self._context = await self._playwright.chromium.launch_persistent_context(**kw)
 
-        # Inject fingerprint noise scripts if configured
-        await self._inject_fingerprint_noise()
+        # Inject fingerprint noise scripts if configured (checked here so
+        # the default no-noise config skips the coroutine entirely)
+        fp = self.config.fingerprint
+        if fp.canvas_noise or fp.audio_noise:
+            await self._inject_fingerprint_noise()
 
-        logger.info(f"Patchright browser started (headless={self.config.headless})")
-        logger.debug(f"User data dir: {self._user_data_dir}")
-        logger.debug(f"Launch args: {args}")
+        logger.info("Patchright browser started (headless=%s)", self.config.headless)
+        if logger.isEnabledFor(logging.DEBUG):
+            # The args repr alone stringifies ~20 elements; skip it all
+            # unless debug logging is actually on
+            logger.debug("User data dir: %s", self._user_data_dir)
+            logger.debug("Launch args: %s", args)
 
     async def close(self) -> None:
         """Close browser and cleanup."""
@@ -172,13 +362,30 @@ class StealthBrowser:
             await self._playwright.stop()
             self._playwright = None
 
-        # Optionally cleanup temp user data dir
-        if self._user_data_dir and self._user_data_dir.startswith(tempfile.gettempdir()):
+        # Temp profile is kept by default so a later start() warm-starts
+        # Chrome from it; drop it here only when reuse is disabled
+        if not self.config.reuse_profile:
+            self._cleanup_user_data_dir()
+
+    def _cleanup_user_data_dir(self) -> None:
+        """Remove the temp profile directory if this browser created it."""
+        if self._owns_user_data_dir and self._user_data_dir:
             try:
                 import shutil
                 shutil.rmtree(self._user_data_dir, ignore_errors=True)
             except Exception as e:
-                logger.warning(f"Failed to cleanup user data dir: {e}")
+                logger.warning("Failed to cleanup user data dir: %s", e)
+            self._user_data_dir = None
+            self._owns_user_data_dir = False
+
+    async def dispose(self) -> None:
+        """Close the browser and delete its temp profile directory."""
+        await self.close()
+        self._cleanup_user_data_dir()
+
+    def __del__(self):
+        # Best-effort: don't leave temp profiles behind at GC time
+        self._cleanup_user_data_dir()
 
     async def new_context(self, **kwargs) -> BrowserContext:
         """
@@ -219,91 +426,36 @@ class StealthBrowser:
 
         Patchright handles CDP-level patches (Runtime.enable leak, etc).
         We add Blink-level and UI flags that Patchright doesn't cover.
+        The args are a pure function of a few config bits, so repeated
+        launches with the same settings hit the module-level cache.
         """
-        fp = self.config.fingerprint
+        import platform
 
-        args = [
-            # CRITICAL: prevents navigator.webdriver=true at the Blink level
-            # Patchright patches CDP, but this flag patches the renderer itself
-            "--disable-blink-features=AutomationControlled",
-
-            # Suppress first-run dialogs
-            "--no-first-run",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--no-default-browser-check",
-
-            # Disable infobars (e.g. "Chrome is being controlled by automated software")
-            "--disable-infobars",
-            "--disable-popup-blocking",
-            "--disable-component-update",
-            "--disable-default-apps",
-
-            # Window size (realistic desktop)
-            #"--window-size=1920,1080",
-        ]
-
-        # Fix User-Agent in headless mode: Chrome adds "HeadlessChrome" which is detectable
-        # We replace it with the normal Chrome UA to avoid detection
-        # NOTE: We use a recent stable Chrome UA. The exact version doesn't matter much
-        # as long as it's consistent with the installed Chrome (which Patchright uses).
-        # The key is removing "HeadlessChrome" from the string.
-        if self.config.headless:
-            import platform
-
-            # Detect OS and build appropriate User-Agent
-            system = platform.system()
-            if system == "Windows":
-                # Windows 10/11 User-Agent
-                user_agent = (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/131.0.0.0 Safari/537.36"
-                )
-            elif system == "Darwin":
-                # macOS User-Agent
-                user_agent = (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/131.0.0.0 Safari/537.36"
-                )
-            else:
-                # Linux User-Agent
-                user_agent = (
-                    "Mozilla/5.0 (X11; Linux x86_64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/131.0.0.0 Safari/537.36"
-                )
-
-            args.append(f"--user-agent={user_agent}")
-            logger.debug(f"Headless mode: overriding User-Agent to hide HeadlessChrome ({system})")
-
-        #WebGL: only add flags when DISABLING (enabled by default in Chrome)
-        if not fp.webgl:
-            args.extend(["--disable-webgl", "--disable-webgl2"])
-            logger.debug("WebGL disabled by fingerprint config")
-
-        # WebRTC: block IP leak when disabled (important with proxy)
-        if not fp.webrtc:
-            args.append("--enforce-webrtc-ip-permission-check")
-            args.append("--disable-webrtc-multiple-routes")
-            args.append("--disable-webrtc-hw-encoding")
-            logger.debug("WebRTC IP leak protection enabled by fingerprint config")
-
-        # Add user-specified extra args
-        if hasattr(self.config, 'extra_args') and self.config.extra_args:
-            args.extend(self.config.extra_args)
-
-        return args
+        fp = self.config.fingerprint
+        return list(_compute_stealth_args(
+            fp.webgl,
+            fp.webrtc,
+            self.config.headless,
+            tuple(self.config.extra_args or ()),
+            platform.system(),
+        ))
 
     async def _inject_fingerprint_noise(self) -> None:
-        """Inject canvas/audio noise scripts if configured."""
-        fp = self.config.fingerprint
+        """Inject canvas/audio noise scripts if configured.
 
-        if fp.canvas_noise:
-            await self._context.add_init_script(script=_CANVAS_NOISE_SCRIPT)
-            logger.debug("Canvas noise injection enabled")
+        Enabled scripts are concatenated into one add_init_script call:
+        each call is a CDP round-trip and a separate V8 compilation on
+        every future navigation, and the scripts are self-contained
+        IIFEs so they compose safely.
+        """
+        fp = self.config.fingerprint
 
-        if fp.audio_noise:
-            await self._context.add_init_script(script=_AUDIO_NOISE_SCRIPT)
-            logger.debug("Audio noise injection enabled")
+        script = _composed_noise_script(
+            fp.canvas_noise, fp.audio_noise, fp.noise_in_iframes
+        )
+        if script is not None:
+            await self._context.add_init_script(script=script)
+            logger.debug(
+                "Fingerprint noise injection enabled (canvas=%s, audio=%s)",
+                fp.canvas_noise, fp.audio_noise,
+            )
@@ -1,6 +1,7 @@
 """Synchronous wrapper for Abrasio SDK."""
 
 import asyncio
+import threading
 from typing import Optional, Union, TYPE_CHECKING
 
 from .._api import Abrasio as AsyncAbrasio
@@ -9,23 +10,58 @@ from .._config import AbrasioConfig
 if TYPE_CHECKING:
     from patchright.sync_api import Browser, BrowserContext, Page
 
+# Shared background event loop for all sync calls. Spawning a
+# ThreadPoolExecutor + asyncio.run per call paid thread creation and
+# loop setup/teardown on every new_page()/close(); one daemon thread
+# running one loop amortizes that, and keeps every awaited object on a
+# single loop across calls.
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_thread: Optional[threading.Thread] = None
+_bg_lock = threading.Lock()
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _bg_loop, _bg_thread
+    if _bg_loop is None:
+        with _bg_lock:
+            if _bg_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="abrasio-sync",
+                    daemon=True,
+                )
+                thread.start()
+                _bg_thread = thread
+                _bg_loop = loop
+    return _bg_loop
+
 
 def _run_sync(coro):
-    """Run an async coroutine synchronously.
+    """Run an async coroutine synchronously on the background loop.
+
+    Safe both from plain sync code and from inside a running event loop
+    (e.g. Jupyter notebooks), since the coroutine always executes on its
+    own thread.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_bg_loop()).result()
+
+
+async def _gather_all(coros):
+    return await asyncio.gather(*coros)
+
+
+def run_many_sync(*coros):
+    """Run several coroutines in a single loop entry.
 
-    Compatible with Python 3.8+ including 3.10+ where
-    get_event_loop() emits DeprecationWarning without a running loop.
+    One run_coroutine_threadsafe submission instead of one per
+    coroutine — batching N operations saves N-1 thread round-trips.
+
+    Returns:
+        Results in the same order as the coroutines
     """
-    try:
-        asyncio.get_running_loop()
-        # Already inside an event loop (e.g. Jupyter notebooks).
-        # Run in a separate thread to avoid blocking.
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            return pool.submit(asyncio.run, coro).result()
-    except RuntimeError:
-        # No running loop — safe to create one
-        return asyncio.run(coro)
+    return _run_sync(_gather_all(coros))
 
 
 class Abrasio:
@@ -39,6 +75,8 @@ class Abrasio:
             print(page.title())
     """
 
+    __slots__ = ("_async_abrasio",)
+
     def __init__(
         self,
         config: Optional[Union[AbrasioConfig, str]] = None,
@@ -85,6 +123,21 @@ class Abrasio:
         """Create a new browser context."""
         return _run_sync(self._async_abrasio.new_context(**kwargs))
 
+    def batch(self, coros) -> list:
+        """Run several async operations in one loop entry.
+
+        Usage:
+            page = browser.new_page()
+            title, _ = browser.batch([page.title(), page.reload()])
+
+        Args:
+            coros: Iterable of coroutines from the async API
+
+        Returns:
+            Results in the same order as the coroutines
+        """
+        return run_many_sync(*coros)
+
     @property
     def browser(self) -> "Browser":
         """Get the underlying browser."""
@@ -18,9 +18,23 @@ References:
 Install: pip install abrasio[fingerprint]
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, FrozenSet, List, Tuple
+import functools
+import itertools
 import random
 import logging
+import re
+import sys
+import types
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+
+# Same slotted-dataclass guard as _config: slots=True needs Python 3.10+
+if sys.version_info >= (3, 10):
+    _SLOTS = {"slots": True}
+else:
+    _SLOTS = {}
 
 logger = logging.getLogger("abrasio.fingerprint")
 
@@ -59,7 +73,15 @@ COMMON_SCREENS = [
     {"width": 1680, "height": 1050, "weight": 2},
 ]
 
+# Precomputed structure-of-arrays view of COMMON_SCREENS: one bisect over
+# the cumulative weights replaces the per-call filter + linear scan in the
+# (overwhelmingly common) unconstrained case.
+_SCREEN_DIMS = tuple((s["width"], s["height"]) for s in COMMON_SCREENS)
+_SCREEN_CUM = array("I", itertools.accumulate(s["weight"] for s in COMMON_SCREENS))
+_SCREEN_TOTAL = _SCREEN_CUM[-1]
+
 # Common locales by usage
+# (precomputed population/cum-weight views below, as for COMMON_SCREENS)
 COMMON_LOCALES = [
     ("en-US", "America/New_York", 30),
     ("en-GB", "Europe/London", 8),
@@ -73,6 +95,9 @@ COMMON_LOCALES = [
     ("it-IT", "Europe/Rome", 2),
 ]
 
+_LOCALE_POP = tuple((l, t) for l, t, _ in COMMON_LOCALES)
+_LOCALE_CUM = array("I", itertools.accumulate(w for _, _, w in COMMON_LOCALES))
+
 # Comprehensive region to locale/timezone mapping
 # Maps ISO 3166-1 alpha-2 country codes to (locale, timezone, valid_timezones)
 REGION_CONFIG = {
@@ -153,6 +178,156 @@ REGION_CONFIG = {
     "KE": {"locale": "en-KE", "timezone": "Africa/Nairobi", "valid_timezones": ["Africa/Nairobi"]},
 }
 
+# Region -> (locale, timezone) shortcut derived from REGION_CONFIG, so
+# get_realistic_locale never rebuilds a mapping per call — and covers every
+# supported region rather than a hand-picked subset.
+_LOCALE_REGION_MAP = {
+    code: (cfg["locale"], cfg["timezone"]) for code, cfg in REGION_CONFIG.items()
+}
+
+@dataclass(frozen=True, **_SLOTS)
+class RegionCfg:
+    """Precomputed per-region lookup record for the hot validation path.
+
+    Attribute loads on a slotted instance beat dict gets, and the language
+    prefix / timezone tuple are computed once at import instead of per call.
+    """
+
+    locale: str
+    timezone: str
+    valid_timezones: FrozenSet[str]
+    valid_tz_tuple: Tuple[str, ...]
+    expected_lang: str
+
+
+# The frozenset (O(1) membership), ordered tuple (error messages) and
+# split language prefix live only on these records; the public
+# REGION_CONFIG dicts keep their original documented shape.
+_REGION_CFG = {
+    code: RegionCfg(
+        locale=cfg["locale"],
+        timezone=cfg["timezone"],
+        valid_timezones=frozenset(cfg["valid_timezones"]),
+        valid_tz_tuple=tuple(cfg["valid_timezones"]),
+        expected_lang=cfg["locale"].split("-", 1)[0],
+    )
+    for code, cfg in REGION_CONFIG.items()
+}
+
+# Multilingual countries where a locale/region language mismatch is normal
+_MULTILINGUAL_REGIONS = frozenset({"CA", "CH", "BE", "SG", "IN"})
+
+# Reverse index: timezone -> regions it is valid for. Lets validators (and
+# downstream callers) answer "does this timezone fit this region" — or the
+# inverse — with two dict probes.
+TZ_TO_REGIONS = {}
+for _code, _cfg in REGION_CONFIG.items():
+    for _tz in _cfg["valid_timezones"]:
+        TZ_TO_REGIONS.setdefault(_tz, set()).add(_code)
+TZ_TO_REGIONS = {tz: frozenset(codes) for tz, codes in TZ_TO_REGIONS.items()}
+del _code, _cfg, _tz
+
+_NO_REGIONS = frozenset()
+
+# The exported table is read-only from here on: all derived indexes above
+# were built from it, and a mutation would silently desynchronize them.
+REGION_CONFIG = types.MappingProxyType(REGION_CONFIG)
+
+# Sorted parallel arrays for bulk lookups: callers validating many rows can
+# bisect the key array instead of hashing into the dict per row.
+_REGION_KEYS = tuple(sorted(REGION_CONFIG))
+_REGION_LOCALES = tuple(REGION_CONFIG[k]["locale"] for k in _REGION_KEYS)
+_REGION_TZS = tuple(REGION_CONFIG[k]["timezone"] for k in _REGION_KEYS)
+
+
+def lookup_region_fast(code: str) -> Optional[Tuple[str, str]]:
+    """
+    Binary-search lookup of (locale, timezone) for a region code.
+
+    Args:
+        code: Uppercase ISO 3166-1 alpha-2 country code
+
+    Returns:
+        Tuple of (locale, timezone), or None for an unknown code
+    """
+    i = bisect_left(_REGION_KEYS, code)
+    if i < len(_REGION_KEYS) and _REGION_KEYS[i] == code:
+        return (_REGION_LOCALES[i], _REGION_TZS[i])
+    return None
+
+
+def _normalize_region(region: str) -> str:
+    """Uppercase a region code, skipping the allocation when the caller
+    already passed canonical ISO form (the common case)."""
+    return region if region.isupper() else region.upper()
+
+
+# NumPy handle for batched sampling: imported on first use so plain
+# `import abrasio` never pays the numpy startup cost. None = not yet
+# attempted, False = unavailable.
+_np = None
+
+
+def _batch_indices(cum, n: int) -> List[int]:
+    """Draw n weighted indices against a cumulative-weight table.
+
+    With NumPy installed this is one vectorized searchsorted call; the
+    fallback is n Python-level bisects, which is still C per probe.
+    """
+    global _np
+    if _np is None:
+        try:
+            import numpy
+
+            _np = numpy
+        except ImportError:
+            _np = False
+    if _np:
+        u = _np.random.random(n) * cum[-1]
+        return _np.searchsorted(_np.asarray(cum), u, side="left")
+    total = cum[-1]
+    return [bisect_left(cum, random.random() * total) for _ in range(n)]
+
+
+def get_realistic_screens(n: int) -> List[Dict[str, int]]:
+    """
+    Batch variant of get_realistic_screen (unconstrained).
+
+    Samples all n resolutions in one vectorized draw when NumPy is
+    available instead of n independent RNG/bisect round-trips.
+
+    Args:
+        n: Number of resolutions to sample
+
+    Returns:
+        List of n dicts with width and height
+    """
+    return [
+        {"width": _SCREEN_DIMS[i][0], "height": _SCREEN_DIMS[i][1]}
+        for i in _batch_indices(_SCREEN_CUM, n)
+    ]
+
+
+def get_realistic_locales(n: int) -> List[Tuple[str, str]]:
+    """
+    Batch variant of get_realistic_locale (no region hint).
+
+    Args:
+        n: Number of combinations to sample
+
+    Returns:
+        List of n (locale, timezone) tuples
+    """
+    return [_LOCALE_POP[i] for i in _batch_indices(_LOCALE_CUM, n)]
+
+
+def _pick_unconstrained() -> Dict[str, int]:
+    """Weighted screen pick with no constraints: one RNG draw + one
+    C-level bisect over the cumulative weights precomputed at import."""
+    i = bisect_left(_SCREEN_CUM, random.random() * _SCREEN_TOTAL)
+    width, height = _SCREEN_DIMS[i]
+    return {"width": width, "height": height}
+
 
 def get_realistic_screen(
     min_width: Optional[int] = None,
@@ -172,33 +347,33 @@ def get_realistic_screen(
     Returns:
         Dict with width and height
     """
+    # Fast path: no constraints means no filtering pass at all
+    if min_width is None and max_width is None and min_height is None and max_height is None:
+        return _pick_unconstrained()
+
     # Filter screens by constraints
     valid_screens = []
-    for screen in COMMON_SCREENS:
-        if min_width and screen["width"] < min_width:
+    for (width, height), screen in zip(_SCREEN_DIMS, COMMON_SCREENS):
+        if min_width and width < min_width:
             continue
-        if max_width and screen["width"] > max_width:
+        if max_width and width > max_width:
             continue
-        if min_height and screen["height"] < min_height:
+        if min_height and height < min_height:
             continue
-        if max_height and screen["height"] > max_height:
+        if max_height and height > max_height:
             continue
-        valid_screens.append(screen)
+        valid_screens.append((width, height, screen["weight"]))
 
     if not valid_screens:
         # Fallback to most common
         return {"width": 1920, "height": 1080}
 
-    # Weighted random selection
-    total_weight = sum(s["weight"] for s in valid_screens)
-    r = random.uniform(0, total_weight)
-    cumulative = 0
-    for screen in valid_screens:
-        cumulative += screen["weight"]
-        if r <= cumulative:
-            return {"width": screen["width"], "height": screen["height"]}
-
-    return {"width": valid_screens[0]["width"], "height": valid_screens[0]["height"]}
+    # Weighted random selection (random.choices runs the cumulative scan
+    # via bisect instead of a Python loop)
+    width, height, _ = random.choices(
+        valid_screens, weights=[s[2] for s in valid_screens]
+    )[0]
+    return {"width": width, "height": height}
 
 
 def get_realistic_locale(region: Optional[str] = None) -> Tuple[str, str]:
@@ -212,32 +387,12 @@ def get_realistic_locale(region: Optional[str] = None) -> Tuple[str, str]:
         Tuple of (locale, timezone)
     """
     if region:
-        # Map region to locale
-        region_map = {
-            "US": ("en-US", "America/New_York"),
-            "BR": ("pt-BR", "America/Sao_Paulo"),
-            "GB": ("en-GB", "Europe/London"),
-            "DE": ("de-DE", "Europe/Berlin"),
-            "FR": ("fr-FR", "Europe/Paris"),
-            "ES": ("es-ES", "Europe/Madrid"),
-            "JP": ("ja-JP", "Asia/Tokyo"),
-            "CN": ("zh-CN", "Asia/Shanghai"),
-            "KR": ("ko-KR", "Asia/Seoul"),
-            "IT": ("it-IT", "Europe/Rome"),
-        }
-        if region.upper() in region_map:
-            return region_map[region.upper()]
-
-    # Weighted random selection
-    total_weight = sum(l[2] for l in COMMON_LOCALES)
-    r = random.uniform(0, total_weight)
-    cumulative = 0
-    for locale, timezone, weight in COMMON_LOCALES:
-        cumulative += weight
-        if r <= cumulative:
-            return (locale, timezone)
+        hit = _LOCALE_REGION_MAP.get(_normalize_region(region))
+        if hit:
+            return hit
 
-    return COMMON_LOCALES[0][:2]
+    # Weighted random selection over precomputed cumulative weights
+    return random.choices(_LOCALE_POP, cum_weights=_LOCALE_CUM)[0]
 
 
 def generate_fingerprint(
@@ -267,6 +422,40 @@ def generate_fingerprint(
         - headers: HTTP headers
         - webgl: WebGL properties (if available)
 
+    Raises:
+        ImportError: If browserforge is not installed
+    """
+    return generate_fingerprints(1, browser=browser, os=os, device=device,
+                                 locale=locale, screen=screen)[0]
+
+
+def generate_fingerprints(
+    n: int,
+    browser: str = "chrome",
+    os: Optional[str] = None,
+    device: str = "desktop",
+    locale: Optional[str] = None,
+    screen: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generate n fingerprints, amortizing generator construction.
+
+    FingerprintGenerator/HeaderGenerator load BrowserForge's distribution
+    tables on construction, so the pair is built once per (browser, os,
+    device) combination and reused across calls. BrowserForge generators
+    are not documented as thread-safe; share batches within one thread.
+
+    Args:
+        n: Number of fingerprints to generate
+        browser: Browser type ("chrome", "firefox", "safari", "edge")
+        os: Operating system ("windows", "macos", "linux") - random if None
+        device: Device type ("desktop", "mobile")
+        locale: Locale string (e.g., "en-US") - random if None
+        screen: Screen constraints {"min_width", "max_width", etc.}
+
+    Returns:
+        List of n fingerprint dicts (see generate_fingerprint)
+
     Raises:
         ImportError: If browserforge is not installed
     """
@@ -282,52 +471,82 @@ def generate_fingerprint(
             max_height=screen.get("max_height"),
         )
 
-    # Generate fingerprint
+    generator, header_gen = _build_generators(browser, os, device)
+
+    results = []
+    for _ in range(n):
+        fp = generator.generate(screen=screen_obj)
+        headers = header_gen.generate()
+        results.append(_build_result(fp, headers, locale))
+    return results
+
+
+@functools.lru_cache(maxsize=16)
+def _build_generators(browser: str, os: Optional[str], device: str):
+    """Construct (and cache) a FingerprintGenerator/HeaderGenerator pair."""
     generator = FingerprintGenerator(
         browser=browser,
         os=os,
         device=device,
     )
-
-    fp = generator.generate(screen=screen_obj)
-
-    # Generate matching headers
     header_gen = HeaderGenerator(
         browser=browser,
         os=os,
         device=device,
     )
-    headers = header_gen.generate()
+    return generator, header_gen
+
+
+def _build_result(fp, headers, locale: Optional[str]) -> Dict[str, Any]:
+    """Shape a generated fingerprint into the public result dict."""
+    # Probe each sub-object once instead of hasattr per field
+    nav = getattr(fp, "navigator", None)
+    scr = getattr(fp, "screen", None)
+    wgl = getattr(fp, "webgl", None)
+
+    # HeaderGenerator already returns a fresh dict per generate() call, so
+    # copying it again is wasted work; only coerce non-dict shapes.
+    hdr = headers or {}
+    if not isinstance(hdr, dict):
+        hdr = dict(hdr)
 
-    # Build result
     result = {
         "navigator": {
-            "userAgent": fp.navigator.userAgent if hasattr(fp, 'navigator') else None,
-            "platform": fp.navigator.platform if hasattr(fp, 'navigator') else None,
-            "language": locale or (fp.navigator.language if hasattr(fp, 'navigator') else "en-US"),
-            "hardwareConcurrency": fp.navigator.hardwareConcurrency if hasattr(fp, 'navigator') else 8,
-            "deviceMemory": fp.navigator.deviceMemory if hasattr(fp, 'navigator') else 8,
+            "userAgent": nav.userAgent if nav else None,
+            "platform": nav.platform if nav else None,
+            "language": locale or (nav.language if nav else "en-US"),
+            "hardwareConcurrency": nav.hardwareConcurrency if nav else 8,
+            "deviceMemory": nav.deviceMemory if nav else 8,
         },
         "screen": {
-            "width": fp.screen.width if hasattr(fp, 'screen') else 1920,
-            "height": fp.screen.height if hasattr(fp, 'screen') else 1080,
-            "colorDepth": fp.screen.colorDepth if hasattr(fp, 'screen') else 24,
-            "pixelRatio": fp.screen.pixelRatio if hasattr(fp, 'screen') else 1,
+            "width": scr.width if scr else 1920,
+            "height": scr.height if scr else 1080,
+            "colorDepth": scr.colorDepth if scr else 24,
+            "pixelRatio": scr.pixelRatio if scr else 1,
         },
-        "headers": dict(headers) if headers else {},
+        "headers": hdr,
     }
 
     # Add WebGL if available
-    if hasattr(fp, 'webgl') and fp.webgl:
+    if wgl:
         result["webgl"] = {
-            "vendor": fp.webgl.vendor,
-            "renderer": fp.webgl.renderer,
+            "vendor": wgl.vendor,
+            "renderer": wgl.renderer,
         }
 
-    logger.debug(f"Generated fingerprint: {result['navigator']['userAgent']}")
+    logger.debug("Generated fingerprint: %s", result["navigator"]["userAgent"])
     return result
 
 
+# Token tables for validate_fingerprint_consistency: one compiled-regex
+# scan per string replaces a pile of individual substring checks.
+_UA_TOKEN_RE = re.compile(r"windows|mac os|linux|mobile|android|iphone|ipad")
+_GPU_TOKEN_RE = re.compile(r"nvidia|amd|radeon|geforce|apple")
+_OS_TOKENS = frozenset({"windows", "mac os", "linux"})
+_MOBILE_TOKENS = frozenset({"mobile", "android", "iphone"})
+_DESKTOP_GPU_TOKENS = frozenset({"nvidia", "amd", "radeon", "geforce"})
+
+
 def validate_fingerprint_consistency(
     user_agent: str,
     platform: str,
@@ -357,19 +576,22 @@ def validate_fingerprint_consistency(
         List of inconsistency warnings (empty if all consistent)
     """
     warnings = []
-    ua_lower = user_agent.lower()
+    # Single regex pass over the UA instead of ~10 separate substring
+    # scans; subsequent checks are O(1) set membership.
+    ua_tokens = set(_UA_TOKEN_RE.findall(user_agent.lower()))
     platform_lower = platform.lower()
 
-    # Check OS consistency
-    if "windows" in ua_lower and "mac" in platform_lower:
-        warnings.append("UA says Windows but platform says Mac")
-    if "mac os" in ua_lower and "win" in platform_lower:
-        warnings.append("UA says macOS but platform says Windows")
-    if "linux" in ua_lower and ("mac" in platform_lower or "win" in platform_lower):
-        warnings.append("UA says Linux but platform doesn't match")
+    # Check OS consistency (skipped wholesale when no OS token appears)
+    if ua_tokens & _OS_TOKENS:
+        if "windows" in ua_tokens and "mac" in platform_lower:
+            warnings.append("UA says Windows but platform says Mac")
+        if "mac os" in ua_tokens and "win" in platform_lower:
+            warnings.append("UA says macOS but platform says Windows")
+        if "linux" in ua_tokens and ("mac" in platform_lower or "win" in platform_lower):
+            warnings.append("UA says Linux but platform doesn't match")
 
     # Check mobile vs desktop
-    if any(m in ua_lower for m in ["mobile", "android", "iphone"]):
+    if ua_tokens & _MOBILE_TOKENS:
         if screen_width > 1024 or screen_height > 1024:
             warnings.append("Mobile UA but desktop-sized screen")
     else:
@@ -378,17 +600,17 @@ def validate_fingerprint_consistency(
 
     # Check WebGL consistency
     if webgl_vendor and webgl_renderer:
-        vendor_lower = webgl_vendor.lower()
         renderer_lower = webgl_renderer.lower()
+        gpu_tokens = set(_GPU_TOKEN_RE.findall(renderer_lower))
 
         # Apple GPU should only appear on macOS/iOS
-        if "apple" in vendor_lower or "apple" in renderer_lower:
-            if "windows" in ua_lower or "linux" in ua_lower:
+        if "apple" in gpu_tokens or "apple" in webgl_vendor.lower():
+            if "windows" in ua_tokens or "linux" in ua_tokens:
                 warnings.append("Apple GPU with non-Apple OS")
 
         # NVIDIA/AMD typically not on iOS
-        if any(g in renderer_lower for g in ["nvidia", "amd", "radeon", "geforce"]):
-            if "iphone" in ua_lower or "ipad" in ua_lower:
+        if gpu_tokens & _DESKTOP_GPU_TOKENS:
+            if "iphone" in ua_tokens or "ipad" in ua_tokens:
                 warnings.append("Desktop GPU with iOS device")
 
     # Check for unrealistic screen sizes
@@ -431,33 +653,29 @@ def validate_region_consistency(
     if not region:
         return warnings
 
-    region_upper = region.upper()
+    region_upper = _normalize_region(region)
 
-    if region_upper not in REGION_CONFIG:
-        logger.warning(f"Unknown region: {region}. Skipping validation.")
+    config = _REGION_CFG.get(region_upper)
+    if config is None:
+        logger.warning("Unknown region: %s. Skipping validation.", region)
         return warnings
 
-    config = REGION_CONFIG[region_upper]
-    expected_locale = config["locale"]
-    expected_timezone = config["timezone"]
-    valid_timezones = config["valid_timezones"]
-
-    # Check timezone consistency
+    # Check timezone consistency via the reverse index; the joined string
+    # is only built when the warning actually fires
     if timezone:
-        if timezone not in valid_timezones:
+        if region_upper not in TZ_TO_REGIONS.get(timezone, _NO_REGIONS):
             warnings.append(
                 f"Timezone '{timezone}' does not match region '{region}' "
-                f"(expected one of: {', '.join(valid_timezones)})"
+                f"(expected one of: {', '.join(config.valid_tz_tuple)})"
             )
 
     # Check locale consistency (less strict - just check language prefix)
     if locale:
-        expected_lang = expected_locale.split("-")[0]
+        expected_lang = config.expected_lang
         actual_lang = locale.split("-")[0]
 
         # Allow some flexibility for multilingual countries
-        multilingual_regions = {"CA", "CH", "BE", "SG", "IN"}
-        if region_upper not in multilingual_regions:
+        if region_upper not in _MULTILINGUAL_REGIONS:
             if actual_lang != expected_lang:
                 warnings.append(
                     f"Locale '{locale}' language does not match region '{region}' "
@@ -499,16 +717,15 @@ def auto_configure_region(
         ['Timezone mismatch: using America/New_York but region BR expects America/Sao_Paulo']
     """
     warnings = []
-    region_upper = region.upper()
+    region_upper = _normalize_region(region)
 
-    if region_upper not in REGION_CONFIG:
-        logger.warning(f"Unknown region: {region}. Using defaults.")
+    config = _REGION_CFG.get(region_upper)
+    if config is None:
+        logger.warning("Unknown region: %s. Using defaults.", region)
         return (locale or "en-US", timezone or "America/New_York", warnings)
 
-    config = REGION_CONFIG[region_upper]
-    default_locale = config["locale"]
-    default_timezone = config["timezone"]
-    valid_timezones = config["valid_timezones"]
+    default_locale = config.locale
+    default_timezone = config.timezone
 
     # Determine final locale
     final_locale = locale if locale else default_locale
@@ -517,18 +734,17 @@ def auto_configure_region(
     final_timezone = timezone if timezone else default_timezone
 
     # Validate and warn if mismatches
-    if timezone and timezone not in valid_timezones:
+    if timezone and timezone not in config.valid_timezones:
         warnings.append(
             f"Timezone mismatch: using '{timezone}' but region '{region}' "
-            f"expects one of: {', '.join(valid_timezones)}"
+            f"expects one of: {', '.join(config.valid_tz_tuple)}"
         )
         logger.warning(warnings[-1])
 
     if locale:
-        expected_lang = default_locale.split("-")[0]
+        expected_lang = config.expected_lang
         actual_lang = locale.split("-")[0]
-        multilingual_regions = {"CA", "CH", "BE", "SG", "IN"}
-        if region_upper not in multilingual_regions and actual_lang != expected_lang:
+        if region_upper not in _MULTILINGUAL_REGIONS and actual_lang != expected_lang:
             warnings.append(
                 f"Locale mismatch: using '{locale}' but region '{region}' "
                 f"typically uses '{default_locale}'"
@@ -548,7 +764,7 @@ def get_region_config(region: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with locale, timezone, and valid_timezones, or None if unknown region
     """
-    return REGION_CONFIG.get(region.upper())
+    return REGION_CONFIG.get(_normalize_region(region))
 
 
 def list_supported_regions() -> List[str]:
@@ -563,13 +779,18 @@ def list_supported_regions() -> List[str]:
 
 __all__ = [
     "generate_fingerprint",
+    "generate_fingerprints",
     "validate_fingerprint_consistency",
     "validate_region_consistency",
     "auto_configure_region",
     "get_region_config",
     "list_supported_regions",
     "get_realistic_screen",
+    "get_realistic_screens",
     "get_realistic_locale",
+    "get_realistic_locales",
     "BROWSERFORGE_AVAILABLE",
     "REGION_CONFIG",
+    "TZ_TO_REGIONS",
+    "lookup_region_fast",
 ]
@@ -12,6 +12,11 @@ In CLOUD mode, the cloud browser handles this automatically based on the proxy's
 """
 
 import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as _FuturesTimeout
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from functools import lru_cache
@@ -20,6 +25,15 @@ import json
 
 from .fingerprint import REGION_CONFIG
 
+# orjson accepts bytes directly (no intermediate str) and parses in C.
+# Available via the `perf` extra; stdlib json is the fallback.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = lambda b: json.loads(b.decode())  # noqa: E731
+
 logger = logging.getLogger("abrasio.geolocation")
 
 # IP Geolocation APIs (free, no API key required)
@@ -28,11 +42,69 @@ GEOLOCATION_APIS = [
     "https://ipapi.co/json/",
 ]
 
-# Cache duration (in function calls, not time - using lru_cache)
-CACHE_SIZE = 1
+# Request headers shared by every lookup (avoids a per-call dict build)
+_GEO_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# Query all APIs concurrently and take the first success. Sequential
+# fallback means a dead first API adds its full timeout before the second
+# is even tried; in parallel, wall time is the fastest responder. Set to
+# False to restore one-request-at-a-time behaviour.
+PARALLEL_GEO = True
+
+# In-process cache TTL: lookups are keyed on a monotonic-time bucket, so
+# entries expire on their own every TTL without a thread or lock. A
+# process-lifetime cache would go stale when the public IP changes.
+_GEO_TTL = int(os.environ.get("ABRASIO_GEO_TTL", 600))
+
+# On-disk cache: AbrasioConfig() triggers a lookup on every construction in
+# local mode, and the lru_cache only survives one process. A user's public
+# IP rarely changes, so persist the result for a day.
+_DISK_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "abrasio",
+    "geo.json",
+)
+_DISK_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def _read_disk_cache() -> Optional[dict]:
+    """Return cached geolocation data if present and fresh, else None."""
+    try:
+        with open(_DISK_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if time.time() - cached.get("ts", 0) > _DISK_CACHE_TTL:
+            return None
+        data = cached.get("data")
+        if data and data.get("country_code"):
+            logger.debug("Using on-disk geolocation cache")
+            return data
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_disk_cache(data: dict) -> None:
+    """Best-effort persist of a successful lookup."""
+    try:
+        os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+        tmp_path = _DISK_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"ts": time.time(), "data": data}, f)
+        os.replace(tmp_path, _DISK_CACHE_PATH)
+    except OSError as e:
+        logger.debug("Could not write geolocation cache: %s", e)
 
 
-@dataclass
+# Same slotted-dataclass guard as _config: slots=True needs Python 3.10+
+if sys.version_info >= (3, 10):
+    _SLOTS = {"slots": True}
+else:
+    _SLOTS = {}
+
+
+@dataclass(**_SLOTS)
 class GeoLocation:
     """Geolocation result from IP lookup."""
     ip: str
@@ -43,57 +115,94 @@ class GeoLocation:
     error: Optional[str] = None
 
 
-@lru_cache(maxsize=CACHE_SIZE)
-def _fetch_geolocation() -> Optional[dict]:
+@lru_cache(maxsize=4)
+def _fetch_geolocation(_bucket: int) -> Optional[dict]:
     """
     Fetch geolocation data from IP API.
 
-    Cached to avoid repeated API calls.
+    Cached to avoid repeated API calls: in-process via lru_cache keyed on
+    a TTL bucket (see _fetch_geolocation_cached), across processes via a
+    24h on-disk cache.
 
     Returns:
         Dict with geolocation data or None if all APIs fail
     """
-    for api_url in GEOLOCATION_APIS:
+    cached = _read_disk_cache()
+    if cached is not None:
+        return cached
+
+    result = None
+    if PARALLEL_GEO and len(GEOLOCATION_APIS) > 1:
+        # Fire every API at once; first success wins, the rest are dropped.
+        # shutdown(wait=False) rather than a with-block: waiting would block
+        # on the slowest request and forfeit the parallelism win.
+        executor = ThreadPoolExecutor(max_workers=len(GEOLOCATION_APIS))
+        futures = [executor.submit(_fetch_one, url) for url in GEOLOCATION_APIS]
         try:
-            logger.debug(f"Fetching geolocation from {api_url}")
-
-            req = urllib.request.Request(
-                api_url,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            )
-
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
-
-                # Handle ip-api.com format
-                if "status" in data:
-                    if data.get("status") == "success":
-                        return {
-                            "ip": data.get("query", ""),
-                            "country_code": data.get("countryCode", ""),
-                            "timezone": data.get("timezone", ""),
-                        }
-                    else:
-                        logger.warning(f"ip-api.com returned error: {data}")
-                        continue
-
-                # Handle ipapi.co format
-                if "country_code" in data:
+            for future in as_completed(futures, timeout=6):
+                result = future.result()
+                if result is not None:
+                    break
+        except _FuturesTimeout:
+            logger.debug("Geolocation APIs timed out")
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+    else:
+        for api_url in GEOLOCATION_APIS:
+            result = _fetch_one(api_url)
+            if result is not None:
+                break
+
+    if result is not None:
+        _write_disk_cache(result)
+    return result
+
+
+def _fetch_one(api_url: str) -> Optional[dict]:
+    """Query a single geolocation API; return a result dict or None."""
+    try:
+        logger.debug("Fetching geolocation from %s", api_url)
+
+        req = urllib.request.Request(api_url, headers=_GEO_HEADERS)
+
+        with urllib.request.urlopen(req, timeout=5) as response:
+            data = _json_loads(response.read())
+
+            # Handle ip-api.com format
+            if "status" in data:
+                if data.get("status") == "success":
                     return {
-                        "ip": data.get("ip", ""),
-                        "country_code": data.get("country_code", ""),
+                        "ip": data.get("query", ""),
+                        "country_code": data.get("countryCode", ""),
                         "timezone": data.get("timezone", ""),
                     }
+                logger.warning("ip-api.com returned error: %s", data)
+                return None
+
+            # Handle ipapi.co format
+            if "country_code" in data:
+                return {
+                    "ip": data.get("ip", ""),
+                    "country_code": data.get("country_code", ""),
+                    "timezone": data.get("timezone", ""),
+                }
 
-                logger.warning(f"Unexpected API response format: {data}")
+            logger.warning("Unexpected API response format: %s", data)
 
-        except Exception as e:
-            logger.debug(f"Geolocation API {api_url} failed: {e}")
-            continue
+    except Exception as e:
+        logger.debug("Geolocation API %s failed: %s", api_url, e)
 
     return None
 
 
+def _fetch_geolocation_cached() -> Optional[dict]:
+    """Fetch with a rolling TTL: the bucket index rolls over every _GEO_TTL
+    seconds, so the lru_cache entry expires without explicit invalidation."""
+    return _fetch_geolocation(int(time.monotonic() // _GEO_TTL))
+
+
 def detect_geolocation() -> GeoLocation:
     """
     Detect user's geolocation from their public IP address.
@@ -106,7 +215,7 @@ def detect_geolocation() -> GeoLocation:
         >>> print(f"Country: {geo.country_code}, Timezone: {geo.timezone}, Locale: {geo.locale}")
         Country: BR, Timezone: America/Sao_Paulo, Locale: pt-BR
     """
-    data = _fetch_geolocation()
+    data = _fetch_geolocation_cached()
 
     if not data:
         logger.warning("Could not detect geolocation. Using defaults (en-US, America/New_York)")
@@ -130,9 +239,9 @@ def detect_geolocation() -> GeoLocation:
         # Fallback: construct locale from country code
         # e.g., "AR" -> "es-AR", "NL" -> "nl-NL"
         locale = f"en-{country_code}"
-        logger.debug(f"Unknown country code {country_code}, using fallback locale {locale}")
+        logger.debug("Unknown country code %s, using fallback locale %s", country_code, locale)
 
-    logger.info(f"Detected geolocation: {country_code} ({timezone}, {locale})")
+    logger.info("Detected geolocation: %s (%s, %s)", country_code, timezone, locale)
 
     return GeoLocation(
         ip=ip,
@@ -162,8 +271,12 @@ def get_locale_timezone_from_ip() -> Tuple[str, str, str]:
 
 
 def clear_geolocation_cache():
-    """Clear the geolocation cache to force a fresh lookup."""
+    """Clear the geolocation caches (in-process and on-disk) to force a fresh lookup."""
     _fetch_geolocation.cache_clear()
+    try:
+        os.remove(_DISK_CACHE_PATH)
+    except OSError:
+        pass
 
 
 __all__ = [
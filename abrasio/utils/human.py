@@ -14,9 +14,10 @@ References:
 """
 
 import asyncio
+import functools
 import random
 import math
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from typing import Optional, List, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from patchright.async_api import Page
@@ -26,45 +27,107 @@ if TYPE_CHECKING:
 FITTS_A = 0.1  # Reaction time
 FITTS_B = 0.1  # Movement coefficient
 
+# Binomial rows for direct Bernstein evaluation, degree 1..8
+_BINOM = {n: tuple(math.comb(n, k) for k in range(n + 1)) for n in range(1, 9)}
+
+
+@functools.lru_cache(maxsize=32)
+def _sin_envelope(num_steps: int) -> Tuple[float, ...]:
+    """Jitter envelope sin(i/num_steps * pi), i = 0..num_steps.
+
+    Step counts repeat across moves (duration * steps_per_second lands on
+    a small set of values), so the table is shared and the scalar frame
+    loop does no transcendental math at all.
+    """
+    return tuple(math.sin(i / num_steps * math.pi) for i in range(num_steps + 1))
+
 
 def _bezier_point(t: float, points: List[Tuple[float, float]]) -> Tuple[float, float]:
     """
     Calculate point on a Bezier curve at parameter t.
 
-    Uses De Casteljau's algorithm for arbitrary degree curves.
+    Evaluates the Bernstein form directly: the recursive De Casteljau
+    scheme rebuilt O(n^2) intermediate point lists per sample, and this
+    runs once per animation frame. The cubic case (our default: start +
+    two control points + end) is fully unrolled.
     """
-    n = len(points)
-    if n == 1:
+    n = len(points) - 1
+    if n <= 0:
         return points[0]
 
-    new_points = []
-    for i in range(n - 1):
-        x = (1 - t) * points[i][0] + t * points[i + 1][0]
-        y = (1 - t) * points[i][1] + t * points[i + 1][1]
-        new_points.append((x, y))
-
-    return _bezier_point(t, new_points)
+    u = 1.0 - t
+    if n == 3:
+        uu = u * u
+        tt = t * t
+        b0 = u * uu
+        b1 = 3.0 * uu * t
+        b2 = 3.0 * u * tt
+        b3 = t * tt
+        return (
+            b0 * points[0][0] + b1 * points[1][0] + b2 * points[2][0] + b3 * points[3][0],
+            b0 * points[0][1] + b1 * points[1][1] + b2 * points[2][1] + b3 * points[3][1],
+        )
+
+    # General degree: single left-to-right pass using the Bernstein term
+    # recurrence b_{k+1} = b_k * (n-k)/(k+1) * t/u. No per-sample buffer
+    # at all, so each frame-loop sample is pure arithmetic.
+    if u == 0.0:  # t == 1: only the last term survives
+        return (points[n][0], points[n][1])
+    b = u ** n
+    r = t / u
+    x = 0.0
+    y = 0.0
+    for k in range(n + 1):
+        x += b * points[k][0]
+        y += b * points[k][1]
+        b *= r * (n - k) / (k + 1)
+    return (x, y)
 
 
 def _generate_control_points(
     start: Tuple[float, float],
     end: Tuple[float, float],
     num_control: int = 2,
-) -> List[Tuple[float, float]]:
+    rng: "random.Random" = random,
+) -> Sequence:
     """
     Generate control points for a natural-looking Bezier curve.
 
     Creates slight deviations from straight line to mimic human movement.
-    """
-    points = [start]
 
+    Returns a (num_control + 2, 2) float64 array when NumPy is available
+    — one contiguous block the Bernstein basis multiplies directly,
+    instead of num_control + 2 tuple objects to chase pointers through —
+    and a list of (x, y) tuples otherwise. Row indexing works the same
+    either way.
+    """
     dx = end[0] - start[0]
     dy = end[1] - start[1]
-    distance = math.sqrt(dx * dx + dy * dy)
+    distance = math.hypot(dx, dy)
 
     # More deviation for longer distances
     deviation = min(distance * 0.3, 100)
 
+    # A caller-supplied rng means reproducibility is wanted, which the
+    # module-level NumPy generator cannot honour — take the scalar path.
+    np = _get_np()
+    if np and rng is random:
+        points = np.empty((num_control + 2, 2))
+        points[0] = start
+        points[-1] = end
+        t = np.arange(1, num_control + 1) / (num_control + 1)
+        if distance > 0:
+            perp_x = -dy / distance
+            perp_y = dx / distance
+        else:
+            perp_x = perp_y = 0.0
+        offsets = np.random.default_rng().normal(0.0, deviation * 0.5, num_control)
+        points[1:-1, 0] = start[0] + dx * t + perp_x * offsets
+        points[1:-1, 1] = start[1] + dy * t + perp_y * offsets
+        return points
+
+    points = [start]
+
     for i in range(num_control):
         # Position along the line (spread control points)
         t = (i + 1) / (num_control + 1)
@@ -82,7 +145,7 @@ def _generate_control_points(
             perp_x, perp_y = 0, 0
 
         # Random deviation (can go either side)
-        offset = random.gauss(0, deviation * 0.5)
+        offset = rng.gauss(0, deviation * 0.5)
 
         control_x = base_x + perp_x * offset
         control_y = base_y + perp_y * offset
@@ -97,6 +160,7 @@ def _calculate_movement_time(
     distance: float,
     min_time: float = 0.1,
     max_time: float = 1.5,
+    rng: "random.Random" = random,
 ) -> float:
     """
     Calculate movement time based on distance using Fitts's Law.
@@ -112,19 +176,246 @@ def _calculate_movement_time(
     base_time = FITTS_A + FITTS_B * math.log2(1 + distance / 10)
 
     # Add randomness (±20%)
-    time = base_time * random.uniform(0.8, 1.2)
+    time = base_time * rng.uniform(0.8, 1.2)
 
     return max(min_time, min(max_time, time))
 
 
-def _add_jitter(point: Tuple[float, float], amount: float = 1.0) -> Tuple[float, float]:
+def _add_jitter(
+    point: Tuple[float, float],
+    amount: float = 1.0,
+    rng: "random.Random" = random,
+) -> Tuple[float, float]:
     """Add small random jitter to a point (micro-adjustments)."""
     return (
-        point[0] + random.gauss(0, amount),
-        point[1] + random.gauss(0, amount),
+        point[0] + rng.gauss(0, amount),
+        point[1] + rng.gauss(0, amount),
     )
 
 
+# NumPy handle for batched trajectory math: imported on first use so plain
+# `import abrasio` never pays the numpy startup cost. None = not yet
+# attempted, False = unavailable.
+_np = None
+
+
+def _get_np():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np
+
+
+def _path_kernel(ctrl, num_steps, jitter):
+    """Eased + jittered trajectory as an explicit loop over frames.
+
+    Written in nopython-friendly style — plain loops, scalar math, the
+    numpy module via the _np global — so Numba can compile it as-is.
+    Only ever invoked through _get_path_kernel, never interpreted.
+    """
+    n = ctrl.shape[0] - 1
+    out = _np.empty((num_steps + 1, 2))
+    for i in range(num_steps + 1):
+        t = i / num_steps
+        # Cubic ease-in-out
+        if t < 0.5:
+            e = 4.0 * t * t * t
+        else:
+            e = 1.0 - (-2.0 * t + 2.0) ** 3 / 2.0
+        u = 1.0 - e
+        if u == 0.0:
+            x = ctrl[n, 0]
+            y = ctrl[n, 1]
+        else:
+            b = u ** n
+            r = e / u
+            x = 0.0
+            y = 0.0
+            for k in range(n + 1):
+                x += b * ctrl[k, 0]
+                y += b * ctrl[k, 1]
+                b *= r * (n - k) / (k + 1)
+        env = jitter * math.sin(t * math.pi)
+        out[i, 0] = x + _np.random.normal() * env
+        out[i, 1] = y + _np.random.normal() * env
+    return out
+
+
+# Numba-compiled kernel for drag-heavy workloads (thousands of moves per
+# session): the `perf` extra ships numba, and the compiled kernel takes
+# the trajectory math off the profile entirely. Same lazy-handle protocol
+# as _np: None = not yet attempted, False = unavailable.
+_path_kernel_jit = None
+
+
+def _get_path_kernel():
+    global _path_kernel_jit
+    if _path_kernel_jit is None:
+        if not _get_np():
+            _path_kernel_jit = False
+            return None
+        try:
+            import numba
+
+            _path_kernel_jit = numba.njit(cache=True, fastmath=True)(_path_kernel)
+        except ImportError:
+            _path_kernel_jit = False
+    return _path_kernel_jit or None
+
+
+def _generate_path(
+    control_points: List[Tuple[float, float]],
+    num_steps: int,
+    jitter: float,
+    rng: "random.Random" = random,
+) -> List[Tuple[float, float]]:
+    """
+    Precompute the full eased, jittered trajectory.
+
+    Doing all the math up front keeps the dispatch loop down to
+    move + sleep; with NumPy available the whole path is a handful of
+    vectorized ops instead of per-frame scalar transcendentals, and with
+    numba installed (`perf` extra) a compiled kernel replaces even those.
+    """
+    np = _get_np()
+    if np and rng is random:
+        kernel = _get_path_kernel()
+        if kernel is not None:
+            path = kernel(np.asarray(control_points, dtype=np.float64),
+                          num_steps, float(jitter))
+            return [(float(px), float(py)) for px, py in path]
+        n = len(control_points) - 1
+        t = np.linspace(0.0, 1.0, num_steps + 1)
+        eased = np.where(t < 0.5, 4.0 * t ** 3, 1.0 - (-2.0 * t + 2.0) ** 3 / 2.0)
+        u = 1.0 - eased
+        binom = _BINOM.get(n) or tuple(math.comb(n, k) for k in range(n + 1))
+        basis = np.stack(
+            [binom[k] * u ** (n - k) * eased ** k for k in range(n + 1)], axis=1
+        )
+        path = basis @ np.asarray(control_points)
+        envelope = jitter * np.sin(t * np.pi)
+        path += np.random.default_rng().normal(size=path.shape) * envelope[:, None]
+        return [(float(px), float(py)) for px, py in path]
+
+    path = []
+    envelope = _sin_envelope(num_steps)
+    for i in range(num_steps + 1):
+        t = i / num_steps
+        # Cubic ease-in-out
+        if t < 0.5:
+            eased_t = 4 * t * t * t
+        else:
+            eased_t = 1 - pow(-2 * t + 2, 3) / 2
+        point = _bezier_point(eased_t, control_points)
+        # Jitter peaks mid-movement, vanishes at the endpoints
+        path.append(_add_jitter(point, jitter * envelope[i], rng))
+    return path
+
+
+async def _get_cdp_session(page: "Page"):
+    """Long-lived CDP session for input dispatch, cached on the page.
+
+    Creating a session per human_* call costs a Target.attachToTarget
+    round-trip each; one session serves every helper for the lifetime of
+    the page and is torn down with it. Returns None where CDP is not
+    available (non-Chromium contexts).
+    """
+    session = getattr(page, "_abrasio_cdp", None)
+    if session is None:
+        try:
+            session = await page.context.new_cdp_session(page)
+        except Exception:
+            return None
+        page._abrasio_cdp = session
+    return session
+
+
+async def _animate_bezier(
+    page: "Page",
+    session,
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    duration: float,
+    steps_per_second: int,
+    jitter: float,
+    rng: "random.Random" = random,
+) -> None:
+    """Drive one ballistic Bezier segment from start to end."""
+    # Generate Bezier curve control points
+    control_points = _generate_control_points(start, end, rng=rng)
+
+    # Calculate number of steps
+    num_steps = max(int(duration * steps_per_second), 10)
+
+    # Precompute the full eased + jittered path, then just dispatch it
+    path = _generate_path(control_points, num_steps, jitter, rng)
+    frame_delay = duration / num_steps
+
+    # No noise to inject per frame: emit ~4 native stepped moves along the
+    # eased curve and let the driver interpolate between them.
+    if jitter <= 0:
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        bounds = [num_steps * j // 4 for j in range(5)]
+        for j in range(1, 5):
+            seg_steps = bounds[j] - bounds[j - 1]
+            if seg_steps <= 0:
+                continue
+            px, py = path[bounds[j]]
+            await page.mouse.move(px, py, steps=seg_steps)
+            delay = t0 + bounds[j] * frame_delay - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return
+
+    # Frames are paced against an absolute schedule; when the channel
+    # falls more than a frame behind, intermediate points are dropped so
+    # latency stays bounded instead of queueing. The endpoint always goes
+    # through.
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    last = len(path) - 1
+
+    if session is None:
+        for i, (px, py) in enumerate(path):
+            target = t0 + i * frame_delay
+            if loop.time() > target + frame_delay and i != last:
+                continue
+            await page.mouse.move(px, py)
+            delay = target + frame_delay - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return
+
+    pending: list = []
+    try:
+        for i, (px, py) in enumerate(path):
+            target = t0 + i * frame_delay
+            if loop.time() > target + frame_delay and i != last:
+                continue
+            pending.append(asyncio.create_task(session.send(
+                "Input.dispatchMouseEvent",
+                {"type": "mouseMoved", "x": px, "y": py, "buttons": 0},
+            )))
+            if len(pending) >= 16:
+                await asyncio.gather(*pending)
+                pending.clear()
+            delay = target + frame_delay - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if pending:
+            await asyncio.gather(*pending)
+            pending.clear()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 async def human_move_to(
     page: "Page",
     x: float,
@@ -134,12 +425,16 @@ async def human_move_to(
     max_time: float = 1.5,
     steps_per_second: int = 60,
     jitter: float = 0.5,
+    rng: Optional["random.Random"] = None,
 ) -> None:
     """
     Move mouse to position using human-like Bezier curve trajectory.
 
     Based on Camoufox's cursor movement implementation with distance-aware
-    timing and natural trajectories.
+    timing and natural trajectories. Long moves are decomposed into
+    primary / overshoot / correction submovements: real pointing follows
+    a big ballistic motion past or short of the target plus small homing
+    corrections, and a single clean curve is itself a detection signal.
 
     Args:
         page: Patchright Page object
@@ -148,54 +443,69 @@ async def human_move_to(
         min_time: Minimum movement duration in seconds
         max_time: Maximum movement duration in seconds
         steps_per_second: Animation smoothness (higher = smoother)
-        jitter: Amount of micro-adjustment noise
+        jitter: Amount of micro-adjustment noise. With jitter <= 0 the
+            move is emitted as a few native stepped mouse.move calls, so
+            the driver interpolates the intermediate positions and the
+            per-frame round-trips disappear; the trade-off is that no
+            noise can be injected into driver-generated frames.
+        rng: Seeded random.Random for reproducible trajectories (also
+            disables the batched NumPy draws, which have their own
+            generator). Defaults to the global RNG.
     """
-    # Get current mouse position (approximate from viewport center if unknown)
-    try:
-        viewport = page.viewport_size
-        if viewport:
-            current_x = viewport["width"] / 2
-            current_y = viewport["height"] / 2
-        else:
-            current_x, current_y = 500, 300
-    except Exception:
-        current_x, current_y = 500, 300
+    rng = rng or random
+    # Get current mouse position: last position we drove it to if known,
+    # else approximate from the viewport center
+    start = getattr(page, "_abrasio_last_xy", None)
+    if start is None:
+        try:
+            viewport = page.viewport_size
+            if viewport:
+                start = (viewport["width"] / 2, viewport["height"] / 2)
+            else:
+                start = (500, 300)
+        except Exception:
+            start = (500, 300)
 
-    start = (current_x, current_y)
     end = (x, y)
 
     # Calculate distance and movement time
-    distance = math.sqrt((end[0] - start[0]) ** 2 + (end[1] - start[1]) ** 2)
-    duration = _calculate_movement_time(distance, min_time, max_time)
-
-    # Generate Bezier curve control points
-    control_points = _generate_control_points(start, end)
-
-    # Calculate number of steps
-    num_steps = max(int(duration * steps_per_second), 10)
-
-    # Generate path points with easing (slow start, fast middle, slow end)
-    for i in range(num_steps + 1):
-        # Ease-in-out timing function
-        t = i / num_steps
-        # Cubic ease-in-out
-        if t < 0.5:
-            eased_t = 4 * t * t * t
-        else:
-            eased_t = 1 - pow(-2 * t + 2, 3) / 2
-
-        # Get point on Bezier curve
-        point = _bezier_point(eased_t, control_points)
-
-        # Add jitter for micro-adjustments (less at start/end)
-        jitter_amount = jitter * math.sin(t * math.pi)  # Peak in middle
-        point = _add_jitter(point, jitter_amount)
-
-        # Move mouse
-        await page.mouse.move(point[0], point[1])
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    distance = math.hypot(dx, dy)
+    duration = _calculate_movement_time(distance, min_time, max_time, rng)
 
-        # Wait for next frame
-        await asyncio.sleep(duration / num_steps)
+    # Short moves stay a single curve; decomposing a 40px hop would look
+    # more robotic, not less.
+    if distance < 100:
+        phases = [(end, duration)]
+    else:
+        primary_fraction = rng.uniform(0.5, 0.85)
+        overshoot = rng.uniform(0.0, 0.15)
+        mid = (start[0] + dx * primary_fraction, start[1] + dy * primary_fraction)
+        over = (end[0] + dx * overshoot, end[1] + dy * overshoot)
+        rest = 1.0 - primary_fraction
+        phases = [
+            (mid, duration * primary_fraction),
+            (over, duration * rest * 0.6),
+            (end, duration * rest * 0.4),
+        ]
+
+    # Pipeline the moves over a raw CDP session where possible: awaiting
+    # page.mouse.move per frame costs one round-trip each, so a 60-step
+    # motion pays 60x RTT. Fire-and-forget sends with periodic flushes
+    # keep the loop paced by the sleep, not the link.
+    session = await _get_cdp_session(page) if jitter > 0 else None
+
+    pos = start
+    for i, (target, share) in enumerate(phases):
+        if i:
+            # Brief motor-planning pause between submovements
+            await asyncio.sleep(rng.uniform(0.02, 0.08))
+        await _animate_bezier(page, session, pos, target, share,
+                              steps_per_second, jitter, rng)
+        pos = target
+
+    page._abrasio_last_xy = end
 
 
 async def human_click(
@@ -207,6 +517,7 @@ async def human_click(
     offset_range: int = 5,
     move_first: bool = True,
     double_click: bool = False,
+    rng: Optional["random.Random"] = None,
 ) -> None:
     """
     Click with human-like mouse movement and slight position offset.
@@ -219,7 +530,9 @@ async def human_click(
         offset_range: Maximum offset in pixels from center
         move_first: Whether to move mouse naturally before clicking
         double_click: Whether to double-click
+        rng: Seeded random.Random for reproducible behavior
     """
+    rng = rng or random
     # Determine target coordinates
     if selector:
         element = await page.query_selector(selector)
@@ -236,21 +549,29 @@ async def human_click(
             return
 
         # Random position within element (not just center)
-        x = box["x"] + box["width"] * random.uniform(0.3, 0.7)
-        y = box["y"] + box["height"] * random.uniform(0.3, 0.7)
+        x = box["x"] + box["width"] * rng.uniform(0.3, 0.7)
+        y = box["y"] + box["height"] * rng.uniform(0.3, 0.7)
     elif x is None or y is None:
         raise ValueError("Either selector or x,y coordinates must be provided")
 
     # Add small random offset
-    x += random.randint(-offset_range, offset_range)
-    y += random.randint(-offset_range, offset_range)
+    x += rng.randint(-offset_range, offset_range)
+    y += rng.randint(-offset_range, offset_range)
 
-    # Move to position naturally
+    # Move to position naturally — unless the cursor is already next to
+    # the target (common when a human_move_to preceded the click), in
+    # which case a full 60-frame animation to cover a few pixels would
+    # be wasted work. A single direct move suffices there.
     if move_first:
-        await human_move_to(page, x, y)
+        last = getattr(page, "_abrasio_last_xy", None)
+        if last is not None and math.hypot(x - last[0], y - last[1]) < offset_range * 3:
+            await page.mouse.move(x, y)
+            page._abrasio_last_xy = (x, y)
+        else:
+            await human_move_to(page, x, y, rng=rng)
 
     # Small pause before clicking (human reaction time)
-    await asyncio.sleep(random.uniform(0.05, 0.15))
+    await asyncio.sleep(rng.uniform(0.05, 0.15))
 
     # Click
     if double_click:
@@ -264,6 +585,24 @@ COMMON_CHARS = set("etaoinshrdlu ")
 UNCOMMON_CHARS = set("zxqjkvbp")
 
 
+@functools.lru_cache(maxsize=4)
+def _delay_bounds(min_delay_ms: int, max_delay_ms: int) -> Tuple[Tuple[int, int], ...]:
+    """128-entry (lo, hi) keystroke-delay table indexed by ord of the
+    lowercased character.
+
+    Replaces two set lookups and a branch per keystroke with a single
+    index, and gives the NumPy path a table it can gather from to draw
+    every delay in one call.
+    """
+    default = (min_delay_ms, max_delay_ms)
+    table = [default] * 128
+    for ch in COMMON_CHARS:
+        table[ord(ch)] = (min_delay_ms, int(max_delay_ms * 0.6))
+    for ch in UNCOMMON_CHARS:
+        table[ord(ch)] = (int(min_delay_ms * 1.5), max_delay_ms)
+    return tuple(table)
+
+
 async def human_type(
     page: "Page",
     text: str,
@@ -273,6 +612,7 @@ async def human_type(
     max_delay_ms: int = 150,
     mistake_probability: float = 0.02,
     think_pause_probability: float = 0.05,
+    rng: Optional["random.Random"] = None,
 ) -> None:
     """
     Type text with human-like timing, including occasional mistakes.
@@ -291,23 +631,70 @@ async def human_type(
         max_delay_ms: Maximum delay between keystrokes
         mistake_probability: Chance of making a typo (0-1)
         think_pause_probability: Chance of pausing to "think" (0-1)
+        rng: Seeded random.Random for reproducible typing (disables the
+            batched NumPy draws, which have their own generator)
     """
+    rng = rng or random
     if selector:
-        await human_click(page, selector)
-        await asyncio.sleep(random.uniform(0.1, 0.3))
+        await human_click(page, selector, rng=rng)
+        await asyncio.sleep(rng.uniform(0.1, 0.3))
+
+    # Pre-draw the per-character decision uniforms in one batch: with
+    # NumPy that is three vectorized calls instead of 3*len(text) trips
+    # through the Mersenne Twister.
+    np = _get_np()
+    n = len(text)
+    bounds = _delay_bounds(min_delay_ms, max_delay_ms)
+    delays = None
+    if np and rng is random:
+        nprng = np.random.default_rng()
+        burst_draws = nprng.random(n)
+        think_draws = nprng.random(n)
+        mistake_draws = nprng.random(n)
+        # Gather per-character bounds from the LUT and draw every base
+        # delay in one vectorized call. Lowercasing can change the length
+        # for a few exotic code points; fall back to per-char draws then.
+        lowered = text.lower()
+        if len(lowered) == n:
+            codes = np.frombuffer(
+                lowered.encode("ascii", "replace"), dtype=np.uint8
+            )
+            lo, hi = np.asarray(bounds)[codes].T
+            delays = nprng.integers(lo, hi + 1)
+    else:
+        burst_draws = [rng.random() for _ in range(n)]
+        think_draws = [rng.random() for _ in range(n)]
+        mistake_draws = [rng.random() for _ in range(n)]
 
     # Track burst typing (sequences typed faster)
     burst_mode = False
     burst_counter = 0
 
+    # Keystrokes accumulate into runs: page.keyboard.type applies its
+    # per-character delay driver-side, so a run of ordinary characters is
+    # one CDP command instead of one round-trip per key. Runs only break
+    # where something visible happens — a thinking pause or a typo.
+    run_chars: List[str] = []
+    run_delay = 0
+
+    async def _flush_run() -> None:
+        nonlocal run_delay
+        if run_chars:
+            await page.keyboard.type(
+                "".join(run_chars), delay=run_delay // len(run_chars)
+            )
+            run_chars.clear()
+            run_delay = 0
+
     for i, char in enumerate(text):
         # Determine base delay
-        if char.lower() in COMMON_CHARS:
-            base_delay = random.randint(min_delay_ms, int(max_delay_ms * 0.6))
-        elif char.lower() in UNCOMMON_CHARS:
-            base_delay = random.randint(int(min_delay_ms * 1.5), max_delay_ms)
+        if delays is not None:
+            base_delay = int(delays[i])
         else:
-            base_delay = random.randint(min_delay_ms, max_delay_ms)
+            lower = char.lower()
+            code = ord(lower) if len(lower) == 1 else 128
+            lo, hi = bounds[code] if code < 128 else (min_delay_ms, max_delay_ms)
+            base_delay = rng.randint(lo, hi)
 
         # Burst mode (faster typing for short sequences)
         if burst_mode:
@@ -315,43 +702,55 @@ async def human_type(
             burst_counter -= 1
             if burst_counter <= 0:
                 burst_mode = False
-        elif random.random() < 0.1:  # 10% chance to start burst
+        elif burst_draws[i] < 0.1:  # 10% chance to start burst
             burst_mode = True
-            burst_counter = random.randint(3, 8)
+            burst_counter = rng.randint(3, 8)
 
         # Occasional thinking pause
-        if random.random() < think_pause_probability:
-            await asyncio.sleep(random.uniform(0.3, 1.0))
+        if think_draws[i] < think_pause_probability:
+            await _flush_run()
+            await asyncio.sleep(rng.uniform(0.3, 1.0))
 
         # Occasional typo
-        if random.random() < mistake_probability and char.isalpha():
+        if mistake_draws[i] < mistake_probability and char.isalpha():
+            await _flush_run()
             # Type wrong character
-            wrong_char = _get_adjacent_key(char)
+            wrong_char = _get_adjacent_key(char, rng)
             await page.keyboard.type(wrong_char, delay=base_delay)
-            await asyncio.sleep(random.uniform(0.1, 0.3))
+            await asyncio.sleep(rng.uniform(0.1, 0.3))
             # Delete it
             await page.keyboard.press("Backspace")
-            await asyncio.sleep(random.uniform(0.05, 0.15))
+            await asyncio.sleep(rng.uniform(0.05, 0.15))
             # Type correct character
             await page.keyboard.type(char, delay=base_delay)
         else:
-            await page.keyboard.type(char, delay=base_delay)
+            run_chars.append(char)
+            run_delay += base_delay
+
+    await _flush_run()
+
+
+# QWERTY neighbours for typo simulation, flattened to a bytes row per
+# letter (index: ord(letter) - 97). The dict used to be a literal inside
+# _get_adjacent_key, rebuilt on every typo.
+_KEYBOARD_LAYOUT = {
+    "q": "wa", "w": "qeas", "e": "wsdr", "r": "edft", "t": "rfgy",
+    "y": "tghu", "u": "yhji", "i": "ujko", "o": "iklp", "p": "ol",
+    "a": "qwsz", "s": "awedxz", "d": "serfcx", "f": "drtgvc",
+    "g": "ftyhbv", "h": "gyujnb", "j": "huikmn", "k": "jiolm",
+    "l": "kop", "z": "asx", "x": "zsdc", "c": "xdfv", "v": "cfgb",
+    "b": "vghn", "n": "bhjm", "m": "njk",
+}
+_ADJ = tuple(_KEYBOARD_LAYOUT[chr(c)].encode() for c in range(97, 123))
 
 
-def _get_adjacent_key(char: str) -> str:
+def _get_adjacent_key(char: str, rng: "random.Random" = random) -> str:
     """Get a key adjacent to the given character (for typos)."""
-    keyboard_layout = {
-        "q": "wa", "w": "qeas", "e": "wsdr", "r": "edft", "t": "rfgy",
-        "y": "tghu", "u": "yhji", "i": "ujko", "o": "iklp", "p": "ol",
-        "a": "qwsz", "s": "awedxz", "d": "serfcx", "f": "drtgvc",
-        "g": "ftyhbv", "h": "gyujnb", "j": "huikmn", "k": "jiolm",
-        "l": "kop", "z": "asx", "x": "zsdc", "c": "xdfv", "v": "cfgb",
-        "b": "vghn", "n": "bhjm", "m": "njk",
-    }
     lower = char.lower()
-    if lower in keyboard_layout:
-        adjacent = keyboard_layout[lower]
-        wrong = random.choice(adjacent)
+    idx = ord(lower) - 97 if len(lower) == 1 else -1
+    if 0 <= idx < 26:
+        row = _ADJ[idx]
+        wrong = chr(row[rng.randrange(len(row))])
         return wrong.upper() if char.isupper() else wrong
     return char
 
@@ -363,6 +762,7 @@ async def human_scroll(
     *,
     smooth: bool = True,
     duration: float = 0.5,
+    rng: Optional["random.Random"] = None,
 ) -> None:
     """
     Scroll with human-like momentum and variable speed.
@@ -373,38 +773,77 @@ async def human_scroll(
         amount: Pixels to scroll (random 200-600 if not specified)
         smooth: Whether to use smooth scrolling animation
         duration: Duration of smooth scroll in seconds
+        rng: Seeded random.Random for reproducible behavior
     """
+    rng = rng or random
     if amount is None:
-        amount = random.randint(200, 600)
+        amount = rng.randint(200, 600)
 
     if direction == "up":
         amount = -amount
 
     if not smooth:
         await page.mouse.wheel(0, amount)
-        await asyncio.sleep(random.uniform(0.1, 0.3))
+        await asyncio.sleep(rng.uniform(0.1, 0.3))
         return
 
     # Smooth scrolling with momentum
     steps = max(int(duration * 30), 5)
     step_amount = amount / steps
 
-    for i in range(steps):
-        # Ease-out (fast start, slow end) for momentum feel
-        t = i / steps
-        eased = 1 - pow(1 - t, 3)
-        current_step = step_amount * (1 - eased * 0.5)  # Slow down at end
-
-        await page.mouse.wheel(0, current_step)
-        await asyncio.sleep(duration / steps)
-
-    # Small pause after scroll
-    await asyncio.sleep(random.uniform(0.1, 0.3))
+    # Same pipelining as human_move_to: awaiting page.mouse.wheel per step
+    # costs a round-trip each, so wheel events are fired over the shared
+    # CDP session without awaiting and gathered once at the end.
+    session = await _get_cdp_session(page)
+
+    if session is None:
+        for i in range(steps):
+            # Ease-out (fast start, slow end) for momentum feel
+            t = i / steps
+            eased = 1 - pow(1 - t, 3)
+            current_step = step_amount * (1 - eased * 0.5)  # Slow down at end
+
+            await page.mouse.wheel(0, current_step)
+            if i != steps - 1:
+                await asyncio.sleep(duration / steps)
+    else:
+        # Anchor the synthetic wheel events at the viewport centre
+        try:
+            viewport = page.viewport_size
+            wx = viewport["width"] / 2 if viewport else 500
+            wy = viewport["height"] / 2 if viewport else 300
+        except Exception:
+            wx, wy = 500, 300
+
+        pending: list = []
+        try:
+            for i in range(steps):
+                t = i / steps
+                eased = 1 - pow(1 - t, 3)
+                current_step = step_amount * (1 - eased * 0.5)
+
+                pending.append(asyncio.create_task(session.send(
+                    "Input.dispatchMouseEvent",
+                    {"type": "mouseWheel", "x": wx, "y": wy,
+                     "deltaX": 0, "deltaY": current_step},
+                )))
+                if i != steps - 1:
+                    await asyncio.sleep(duration / steps)
+            await asyncio.gather(*pending)
+            pending.clear()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    # Fold the last step's pacing sleep into the post-scroll pause: one
+    # timer instead of two back-to-back wakeups.
+    await asyncio.sleep(duration / steps + rng.uniform(0.1, 0.3))
 
 
 async def random_delay(
     min_ms: int = 100,
     max_ms: int = 500,
+    rng: Optional["random.Random"] = None,
 ) -> None:
     """
     Wait for a random duration to simulate human behavior.
@@ -412,14 +851,16 @@ async def random_delay(
     Args:
         min_ms: Minimum delay in milliseconds
         max_ms: Maximum delay in milliseconds
+        rng: Seeded random.Random for reproducible behavior
     """
-    delay = random.randint(min_ms, max_ms) / 1000
+    delay = (rng or random).randint(min_ms, max_ms) / 1000
     await asyncio.sleep(delay)
 
 
 async def human_wait(
     min_seconds: float = 0.5,
     max_seconds: float = 2.0,
+    rng: Optional["random.Random"] = None,
 ) -> None:
     """
     Wait with human-like variability.
@@ -429,9 +870,10 @@ async def human_wait(
     Args:
         min_seconds: Minimum wait time
         max_seconds: Maximum wait time
+        rng: Seeded random.Random for reproducible behavior
     """
     # Beta distribution skewed toward shorter waits
-    wait = min_seconds + (max_seconds - min_seconds) * (random.betavariate(2, 5))
+    wait = min_seconds + (max_seconds - min_seconds) * (rng or random).betavariate(2, 5)
     await asyncio.sleep(wait)
 
 
@@ -439,6 +881,7 @@ async def simulate_reading(
     page: "Page",
     min_seconds: float = 2.0,
     max_seconds: float = 8.0,
+    rng: Optional["random.Random"] = None,
 ) -> None:
     """
     Simulate a user reading a page (scrolling, pausing).
@@ -447,18 +890,32 @@ async def simulate_reading(
         page: Patchright Page object
         min_seconds: Minimum reading time
         max_seconds: Maximum reading time
+        rng: Seeded random.Random for reproducible behavior
     """
-    reading_time = random.uniform(min_seconds, max_seconds)
-    elapsed = 0
-
+    rng = rng or random
+    reading_time = rng.uniform(min_seconds, max_seconds)
+
+    # Pre-roll the whole schedule before any I/O: one pass of RNG draws
+    # produces (idle, scroll_amount) events with consecutive idle
+    # stretches already coalesced, so the execution loop is nothing but
+    # one sleep per event and the scrolls themselves.
+    events: List[Tuple[float, int]] = []
+    elapsed = 0.0
+    pending_wait = 0.0
     while elapsed < reading_time:
-        # Random action: scroll or just wait
-        if random.random() < 0.3:
-            await human_scroll(page, "down", random.randint(100, 300))
-
-        wait = random.uniform(0.5, 2.0)
-        await asyncio.sleep(wait)
+        if rng.random() < 0.3:
+            events.append((pending_wait, rng.randint(100, 300)))
+            pending_wait = 0.0
+        wait = rng.uniform(0.5, 2.0)
+        pending_wait += wait
         elapsed += wait
+    events.append((pending_wait, 0))
+
+    for idle, scroll_amount in events:
+        if idle > 0:
+            await asyncio.sleep(idle)
+        if scroll_amount:
+            await human_scroll(page, "down", scroll_amount, rng=rng)
 
 
 __all__ = [
@@ -11,7 +11,7 @@ Before running:
 
 import asyncio
 import os
-from abrasio import Abrasio
+from abrasio import Abrasio, drain
 from abrasio.utils import human_scroll, human_wait, simulate_reading
 
 
@@ -53,6 +53,10 @@ async def main():
         await page.screenshot(path="cloud_screenshot.png")
         print("Screenshot saved to cloud_screenshot.png")
 
+    # The cloud finish_session call is scheduled in the background when the async with
+    # block exits; wait for it before the loop shuts down
+    await drain()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
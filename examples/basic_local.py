@@ -14,7 +14,7 @@ Before running:
 """
 
 import asyncio
-from abrasio import Abrasio
+from abrasio import Abrasio, drain
 
 
 async def main():
@@ -51,6 +51,10 @@ async def main():
         # Keep browser open for manual inspection
         input("\nPress Enter to close browser...")
 
+    # Browser close is scheduled in the background when the async with
+    # block exits; wait for it before the loop shuts down
+    await drain()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
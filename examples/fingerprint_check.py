@@ -10,7 +10,7 @@ Install: pip install abrasio[fingerprint]
 """
 
 import asyncio
-from abrasio import Abrasio
+from abrasio import Abrasio, drain
 
 # Try to import fingerprint utilities
 try:
@@ -149,6 +149,10 @@ async def main():
 
         input("\nPress Enter to close browser...")
 
+    # Browser close is scheduled in the background when the async with
+    # block exits; wait for it before the loop shuts down
+    await drain()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -12,7 +12,7 @@ user interaction patterns.
 """
 
 import asyncio
-from abrasio import Abrasio
+from abrasio import Abrasio, drain
 from abrasio.utils import (
     human_click,
     human_type,
@@ -95,6 +95,10 @@ async def main():
         # Keep browser open for inspection
         input("\nPress Enter to close...")
 
+    # Browser close is scheduled in the background when the async with
+    # block exits; wait for it before the loop shuts down
+    await drain()
+
 
 if __name__ == "__main__":
     asyncio.run(main())